@@ -229,10 +229,13 @@ class MicMuteHandler(EventHandler):
                 except Exception:
                     _LOGGER.debug("Failed to sync mute state to ESPHome", exc_info=True)
 
+            # Forward the originator (if any) so it can ignore its own echo
+            source = data.get("source")
+            payload = {"source": source} if source else None
             if is_muted:
-                self.event_bus.publish("mic_muted")
+                self.event_bus.publish("mic_muted", payload)
             else:
-                self.event_bus.publish("mic_unmuted")
+                self.event_bus.publish("mic_unmuted", payload)
 
     @subscribe
     def set_num_leds(self, data: dict):
@@ -595,6 +598,15 @@ async def main() -> None:
             _LOGGER.debug("Stopping MQTT controller...")
             state.mqtt_controller.stop()
 
+        # Wake the button polling threads instead of leaving them mid-sleep
+        for attr in ("xvf3800_button_controller", "button_controller"):
+            controller = getattr(state, attr, None)
+            if controller is not None:
+                try:
+                    controller.stop()
+                except Exception:
+                    _LOGGER.debug("Stopping %s failed", attr, exc_info=True)
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
@@ -85,6 +85,18 @@ class APIServer(asyncio.Protocol):
         packet_bytes = make_plain_text_packets(packets)
         self._writelines(packet_bytes)
 
+    def send_message(self, msg: message.Message) -> None:
+        """Send a single message (hot paths such as streamed mic audio)."""
+        writelines = self._writelines
+        if writelines is None:
+            return
+
+        writelines(
+            make_plain_text_packets(
+                [(PROTO_TO_MESSAGE_TYPE[msg.__class__], msg.SerializeToString())]
+            )
+        )
+
     def connection_made(self, transport) -> None:
         self._transport = transport
         self._writelines = transport.writelines
@@ -34,7 +34,7 @@ except Exception:  # ImportError, RuntimeError, etc.
     GPIO = None  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ButtonRuntimeConfig:
     """Runtime-safe config wrapper for the hardware button."""
     enabled: bool
@@ -90,6 +90,7 @@ class ButtonController:
         )
 
         self._thread: threading.Thread | None = None
+        self._shutdown_flag = threading.Event()
         self._press_time: float | None = None
         self._last_level: int | None = None
 
@@ -136,6 +137,16 @@ class ButtonController:
         )
         self._thread.start()
 
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """Wake and join the polling thread (no-op if it never started)."""
+        self._shutdown_flag.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
     # -------------------------------------------------------------------------
     # Polling loop
     # -------------------------------------------------------------------------
@@ -144,11 +155,20 @@ class ButtonController:
         """Background loop to poll the GPIO level and detect presses."""
         _LOGGER.debug("ButtonController polling thread started")
 
-        while not getattr(self.state, "shutdown", False):
+        # The runtime config is frozen, so read it once rather than per tick.
+        # ServerState always defines `shutdown`; bind it once and read it
+        # directly instead of a defaulted getattr per tick.
+        pin = self._cfg.pin
+        interval = self._cfg.poll_interval_seconds
+        gpio_input = GPIO.input  # type: ignore[union-attr]
+        state = self.state
+        wait = self._shutdown_flag.wait
+
+        while not state.shutdown:
             try:
-                level = GPIO.input(self._cfg.pin)  # type: ignore[call-arg]
+                level = gpio_input(pin)  # type: ignore[call-arg]
             except Exception:
-                _LOGGER.exception("Error reading GPIO pin %s", self._cfg.pin)
+                _LOGGER.exception("Error reading GPIO pin %s", pin)
                 break
 
             if self._last_level is None:
@@ -162,7 +182,9 @@ class ButtonController:
                     self._on_released()
                 self._last_level = level
 
-            time.sleep(self._cfg.poll_interval_seconds)
+            # Event wait instead of time.sleep so stop() wakes the thread at once
+            if wait(interval):
+                break
 
         _LOGGER.debug("ButtonController polling thread exiting")
         # Do NOT call GPIO.cleanup() here; other components may use GPIO as well.
@@ -323,11 +323,17 @@ class SendspinPlayerConfig:
     mpv_ao: Optional[str] = None
     mpv_audio_device: Optional[str] = None
     mpv_extra_args: List[str] = field(default_factory=list)
+    # Keep one idle mpv pre-spawned with the last stream's format so the next
+    # stream start does not wait for mpv to launch. Opt-in: the spare stays
+    # resident (and uses memory) until shutdown, which matters on Pi-class boards.
+    mpv_prespawn: bool = False
 
     # Decoder configuration (Milestone 4: wired-through, used in later milestones)
     decoder_backend: str = "auto"  # auto|ffmpeg|none
     ffmpeg_path: str = "ffmpeg"
     ffmpeg_extra_args: List[str] = field(default_factory=list)
+    # Pipe ffmpeg stderr into the debug log (otherwise it is discarded).
+    ffmpeg_debug_stderr: bool = False
 
     def __post_init__(self) -> None:
         self.preferred_codec = str(self.preferred_codec or "pcm").lower().strip()
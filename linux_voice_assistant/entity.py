@@ -49,7 +49,7 @@ from google.protobuf import message
 
 from .api_server import APIServer
 from .mpv_player import MpvMediaPlayer
-from .util import call_all
+from .util import call_all2
 
 if TYPE_CHECKING:
     from .models import ServerState
@@ -115,7 +115,7 @@ class MediaPlayerEntity(ESPHomeEntity):
                 self.music_player.pause()
                 self.announce_player.play(
                     url,
-                    done_callback=lambda: call_all(
+                    done_callback=lambda: call_all2(
                         self.music_player.resume, done_callback
                     ),
                 )
@@ -123,7 +123,7 @@ class MediaPlayerEntity(ESPHomeEntity):
                 # Announce, idle
                 self.announce_player.play(
                     url,
-                    done_callback=lambda: call_all(
+                    done_callback=lambda: call_all2(
                         self.server.send_messages(
                             [self._update_state(MediaPlayerState.IDLE)]
                         ),
@@ -134,7 +134,7 @@ class MediaPlayerEntity(ESPHomeEntity):
             # Music
             self.music_player.play(
                 url,
-                done_callback=lambda: call_all(
+                done_callback=lambda: call_all2(
                     self.server.send_messages(
                         [self._update_state(MediaPlayerState.IDLE)]
                     ),
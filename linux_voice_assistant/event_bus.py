@@ -1,7 +1,7 @@
 """A simple synchronous publish/subscribe event bus."""
 
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,8 +36,10 @@ class EventBus:
         if self.track_events:
             self.events_received.append((topic, data.copy()))
 
-        listeners = self.topics.get(topic, [])
-        _LOGGER.debug(f"Publishing event to {len(listeners)} listeners on topic '{topic}'")
+        listeners = self.topics.get(topic, ())
+        _LOGGER.debug(
+            "Publishing event to %d listeners on topic '%s'", len(listeners), topic
+        )
         for listener in listeners:
             try:
                 listener(data)
@@ -66,16 +68,29 @@ class EventHandler:
     Subclasses must call `self._subscribe_all_methods()` in their __init__.
     """
 
+    # Names of @subscribe methods, resolved once per class when it is defined
+    _subscribed_methods: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        candidates = {name for klass in cls.__mro__ for name in vars(klass)}
+        # Resolve through the class so an undecorated override unsubscribes,
+        # as it did when scanning the instance.
+        cls._subscribed_methods = tuple(
+            sorted(
+                name
+                for name in candidates
+                if hasattr(getattr(cls, name, None), "_event_bus_subscribe")
+            )
+        )
+
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         # Note: Subclasses must call self._subscribe_all_methods()
         # after their own __init__ is complete.
 
     def _subscribe_all_methods(self):
-        """Finds and subscribes all methods decorated with @subscribe."""
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-
-            if hasattr(method, '_event_bus_subscribe'):
-                # The topic is the name of the method itself.
-                self.event_bus.subscribe(method_name, method)
+        """Subscribes all methods decorated with @subscribe."""
+        for method_name in self._subscribed_methods:
+            # The topic is the name of the method itself.
+            self.event_bus.subscribe(method_name, getattr(self, method_name))
@@ -100,7 +100,7 @@ class LedController(EventHandler):
             try:
                 from .xvf3800_led_backend import XVF3800LedBackend  # type: ignore[import]
 
-                self._xvf3800_backend = XVF3800LedBackend()
+                self._xvf3800_backend = XVF3800LedBackend(coalesce_frames=True)
                 self._backend_mode = "xvf3800"
                 self._is_ready = True
                 # XVF3800 ring has a fixed LED count (typically 12)
@@ -215,7 +215,15 @@ class LedController(EventHandler):
         coro = getattr(self, action_method_name)(*args)
         self.current_task = asyncio.run_coroutine_threadsafe(coro, self.loop)
 
+    def _xvf3800_invalidate_cache(self) -> None:
+        # The mute button can cut X0D33 power (and the firmware can change
+        # effects) without us writing anything, so a new state always goes
+        # out in full instead of being skipped as a repeat.
+        if self._xvf3800_backend is not None:
+            self._xvf3800_backend.invalidate_cache()
+
     def _apply_state_effect(self, state_name: str, publish_state: bool = True):
+        self._xvf3800_invalidate_cache()
         # Mute has highest precedence over any voice/idle effects.
         if self._mic_is_muted:
             _LOGGER.debug(
@@ -611,6 +619,7 @@ class LedController(EventHandler):
     def mic_muted(self, data: dict):
         # Mute overlay has precedence over any other state.
         self._mic_is_muted = True
+        self._xvf3800_invalidate_cache()
         # When muted, show a solid dim red on all backends.
         self.run_action("solid", _DIM_RED, 1.0)
 
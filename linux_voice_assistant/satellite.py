@@ -54,7 +54,7 @@ from .entity import (
     WakeWordSensitivityEntity,
 )
 from .models import AvailableWakeWord, ServerState, SatelliteState, WakeWordType
-from .util import call_all
+from .util import call_all2
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -722,7 +722,7 @@ class VoiceSatelliteProtocol(APIServer):
 
     def handle_audio(self, audio_chunk: bytes) -> None:
         if self._is_streaming_audio:
-            self.send_messages([VoiceAssistantAudio(data=audio_chunk)])
+            self.send_message(VoiceAssistantAudio(data=audio_chunk))
 
     def _clear_timer_auto_stop(self) -> None:
         """Cancel any pending auto-stop for the timer alarm."""
@@ -911,7 +911,7 @@ class VoiceSatelliteProtocol(APIServer):
             return
         self.state.tts_player.play(
             self.state.timer_finished_sound,
-            done_callback=lambda: call_all(
+            done_callback=lambda: call_all2(
                 lambda: time.sleep(1.0), self._play_timer_finished
             ),
         )
@@ -14,40 +14,127 @@ Clock-sync / multi-room enhancement:
 from __future__ import annotations
 
 import asyncio
+import ctypes
 import importlib.util
-import json
 import logging
 import os
 import re
 import shutil
+import struct
 import time
 from collections import deque
 from typing import Any, Deque, Optional, Tuple
 
+import numpy as np
+
 _LOGGER = logging.getLogger(__name__)
 
 _BINARY_HEADER_LEN = 9  # 1 byte header + 8 byte server timestamp (us)
+# Parses message type + big-endian server timestamp in a single C call.
+_BINARY_HEADER = struct.Struct(">Bq")
 
 # Sendspin binary message type ranges per the spec:
 # Player role: 4-7 (0b000001xx)
 _PLAYER_MSG_TYPE_MIN = 4
 _PLAYER_MSG_TYPE_MAX = 7
+# Single-op range check: types 4-7 are exactly those with (type & 0xFC) == 0x04.
+_PLAYER_MSG_TYPE_MASK = 0xFC
+
+# Negotiated codec -> index into the per-instance frame routing table.
+_CODEC_PCM = 0
+_CODEC_OPUS = 1
+_CODEC_FLAC = 2
+_CODEC_IDS = {"pcm": _CODEC_PCM, "opus": _CODEC_OPUS, "flac": _CODEC_FLAC}
+
+# Upper bound for PCM coalesced into a single mpv stdin write.
+_PCM_COALESCE_MAX_BYTES = 64 * 1024
+
+# Per-frame diagnostics log every 512th frame (bitmask instead of modulo).
+_FRAME_LOG_MASK = 511
+
+# Decoder stdout: read in large blocks (a read returns whatever the pipe holds,
+# up to this size).
+_DECODER_READ_SIZE = 64 * 1024
+
+# libopus OPUS_BUFFER_TOO_SMALL: the packet holds more samples than frame_size.
+_OPUS_BUFFER_TOO_SMALL = -2
+
+# Settle time for bursts of set_audio_state calls (e.g. a volume slider drag).
+_AUDIO_APPLY_DEBOUNCE_S = 0.03
+
+# Pre-encoded mpv IPC commands (JSON IPC, newline terminated).
+_MPV_IPC_MUTE = {
+    True: b'{"command": ["set_property", "mute", true]}\n',
+    False: b'{"command": ["set_property", "mute", false]}\n',
+}
+_MPV_IPC_VOLUME = b'{"command": ["set_property", "volume", %d]}\n'
 
 
 def _now_us() -> int:
     return int(time.monotonic_ns() // 1_000)
 
 
+class _ChunkFifo:
+    """Bounded single-consumer FIFO for audio chunks.
+
+    Drop-in for the subset of asyncio.Queue the pipeline uses, without the
+    unfinished-task accounting or per-getter Future bookkeeping: items live in
+    a deque and a single Event wakes the one consumer loop.
+    """
+
+    __slots__ = ("_items", "_maxsize", "_ready")
+
+    def __init__(self, maxsize: int) -> None:
+        self._items: Deque[Any] = deque()
+        self._maxsize = int(maxsize)
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, item: Any) -> None:
+        if len(self._items) >= self._maxsize:
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._ready.set()
+
+    def peek_nowait(self) -> Any:
+        """Return the next item without removing it (None when empty)."""
+        return self._items[0] if self._items else None
+
+    def get_nowait(self) -> Any:
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+
 class SendspinPlayerPipeline:
     """Low-latency raw PCM sink using mpv + optional decode stage.
 
     Supported negotiated codecs:
     - pcm: payload is raw PCM s16le frames
-    - flac: payload is FLAC bitstream frames -> decoded by ffmpeg to PCM
+    - flac: payload is FLAC bitstream frames -> decoded in-process by PyAV when
+            available, else by an ffmpeg subprocess.
     - opus: payload is Opus packets; decoded by opuslib when possible, else
             by ffmpeg when needed.
     """
 
+    # mpv rawaudio sample format per stream bit depth.
+    _FMT_BY_DEPTH = {16: "s16le", 24: "s24le", 32: "s32le"}
+
     def __init__(
         self,
         *,
@@ -107,6 +194,10 @@ class SendspinPlayerPipeline:
         self._stream_rate: int = 48000
         self._stream_channels: int = 2
         self._stream_bit_depth: int = 16
+        self._codec_id: int = _CODEC_PCM
+
+        # Frame routing table indexed by `_codec_id` (see _CODEC_*).
+        self._codec_routes = (self._route_pcm, self._route_opus, self._route_flac)
 
         # mpv process (PCM sink)
         self._pcm_proc: Optional[asyncio.subprocess.Process] = None
@@ -115,15 +206,18 @@ class SendspinPlayerPipeline:
         self._pcm_wait_task: Optional[asyncio.Task] = None
 
         # Queue items are (epoch, due_local_us, pcm_bytes)
-        self._pcm_queue: "asyncio.Queue[Tuple[int, int, bytes]]" = asyncio.Queue(maxsize=500)
+        self._pcm_queue: _ChunkFifo = _ChunkFifo(maxsize=500)
 
         # Decoder / transcoder state (for non-PCM codecs)
         self._decoder_proc: Optional[asyncio.subprocess.Process] = None
-        self._decoder_writer_task: Optional[asyncio.Task] = None
-        self._decoder_reader_task: Optional[asyncio.Task] = None
-        self._decoder_stderr_task: Optional[asyncio.Task] = None
+        # Read end of the decoder's stdout pipe. We own it (rather than using a
+        # StreamReader) so decoded PCM is read with one os.read per block.
+        self._decoder_stdout_fd: Optional[int] = None
+        # Single supervising task for the decoder writer/reader/stderr loops so
+        # a stream restart only needs one cancellation point.
+        self._decoder_task: Optional[asyncio.Task] = None
         # Encoded queue items are (epoch, payload_bytes)
-        self._encoded_queue: "asyncio.Queue[Tuple[int, bytes]]" = asyncio.Queue(maxsize=400)
+        self._encoded_queue: _ChunkFifo = _ChunkFifo(maxsize=400)
 
         # Timestamp anchors for ffmpeg decoded output: (epoch, server_ts_us)
         self._encoded_ts_queue: Deque[Tuple[int, int]] = deque()
@@ -140,24 +234,55 @@ class SendspinPlayerPipeline:
         self._opus_backend: str = "none"  # none|opuslib|ffmpeg
         self._opus_decoder: Any = None
         self._opus_max_frame_size: int = 0
+        # opuslib fast path: call libopus directly into a reusable int16 buffer
+        # (opuslib.Decoder.decode allocates a buffer and a list per packet).
+        self._opus_decode_fn: Any = None
+        self._opus_pcm_buf: Any = None
         self._opus_available: bool = False
 
+        # FLAC decoder backend selection
+        self._flac_backend: str = "none"  # none|pyav|ffmpeg
+        self._flac_ctx: Any = None
+        self._pyav_available: bool = False
+
         # FLAC / Opus ffmpeg decoder availability
         self._ffmpeg_path: str = "ffmpeg"
         self._ffmpeg_available: bool = False
 
-        # mpv stderr tail buffer (for post-mortem)
-        self._mpv_stderr_tail: Deque[str] = deque(maxlen=40)
+        # When False (default), decoder stderr goes to /dev/null so healthy
+        # streams don't pay for a pipe + reader task. Enable to debug ffmpeg.
+        self._debug_stderr: bool = bool(self._cfg_get(player_cfg, "ffmpeg_debug_stderr", False))
+
+        # mpv stderr tail buffer (for post-mortem). Raw bytes; decoded only when
+        # the tail is actually logged.
+        self._mpv_stderr_tail: Deque[bytes] = deque(maxlen=40)
 
         # mpv IPC
         self._mpv_ipc_path: Optional[str] = None
         self._mpv_ipc_ready: bool = False
-        self._mpv_ipc_lock = asyncio.Lock()
+        # Audio state is applied by one long-lived task per stream ("latest
+        # state wins"), so IPC writes are ordered without a lock.
+        self._audio_apply_task: Optional[asyncio.Task] = None
+        self._audio_state_event = asyncio.Event()
+        # Persistent IPC connection (opened on first send, closed with the sink).
+        self._mpv_ipc_writer: Optional[asyncio.StreamWriter] = None
+        self._mpv_ipc_reader_task: Optional[asyncio.Task] = None
+
+        # Warm spare mpv (opt-in): after a stream starts, a second mpv is
+        # pre-spawned with the same raw format so the next start skips mpv's
+        # cold start. The active and spare processes use alternating IPC
+        # socket slots.
+        self._mpv_prespawn: bool = bool(self._cfg_get(player_cfg, "mpv_prespawn", False))
+        self._spare_pcm_proc: Optional[asyncio.subprocess.Process] = None
+        self._spare_pcm_key: Optional[Tuple[int, int, int]] = None
+        self._spare_ipc_path: Optional[str] = None
+        self._spare_task: Optional[asyncio.Task] = None
 
         # Serialize heavy stream stop/start so recv loop never blocks.
         self._stream_lock = asyncio.Lock()
 
         # Diagnostics for binary frame flow
+        self._mono = time.monotonic  # bound once; called per frame
         self._pcm_frame_count: int = 0
         self._pcm_first_frame_at: Optional[float] = None
         self._pcm_last_frame_at: Optional[float] = None
@@ -177,7 +302,10 @@ class SendspinPlayerPipeline:
         except Exception:
             pass
 
+        self._decoder_backend: str = str(self._cfg_get(player_cfg, "decoder_backend", "auto") or "auto").lower()
+
         self._opus_available = importlib.util.find_spec("opuslib") is not None
+        self._pyav_available = importlib.util.find_spec("av") is not None
 
         self._ffmpeg_available = shutil.which(self._ffmpeg_path) is not None
 
@@ -221,7 +349,7 @@ class SendspinPlayerPipeline:
         self._muted = bool(muted)
         self._effective_volume = max(0, min(100, int(effective_volume)))
         if self._stream_active:
-            self._loop.create_task(self._apply_mpv_audio_state())
+            self._request_audio_apply()
 
     async def start_stream(
         self,
@@ -256,7 +384,7 @@ class SendspinPlayerPipeline:
 
         if not self._stream_active:
             self._inactive_bin_count += 1
-            if self._inactive_bin_count == 1 or (self._inactive_bin_count % 500) == 0:
+            if self._inactive_bin_count == 1 or (self._inactive_bin_count & _FRAME_LOG_MASK) == 0:
                 _LOGGER.debug(
                     "Sendspin: received binary frame while stream inactive (%d bytes)",
                     len(frame),
@@ -275,40 +403,46 @@ class SendspinPlayerPipeline:
             return
 
         # Decode / route based on negotiated codec
-        if self._stream_codec == "pcm":
-            await self._enqueue_pcm(payload_bytes, server_ts_us=server_ts_us)
-            return
-
-        if self._stream_codec == "opus":
-            pcm = await self._handle_opus_payload(payload_bytes)
-            if pcm is None:
-                # ffmpeg-backed opus path uses encoded queue + decoder timestamps
-                if self._opus_backend == "ffmpeg":
-                    await self._handle_encoded_payload(payload_bytes, codec="opus", server_ts_us=server_ts_us)
-                return
-            await self._enqueue_pcm(pcm, server_ts_us=server_ts_us)
+        codec_id = self._codec_id
+        if codec_id >= 0:
+            await self._codec_routes[codec_id](payload_bytes, server_ts_us)
+
+    async def _route_pcm(self, payload: bytes, server_ts_us: int) -> None:
+        await self._enqueue_pcm(payload, server_ts_us=server_ts_us)
+
+    async def _route_opus(self, payload: Any, server_ts_us: int) -> None:
+        if self._opus_backend == "opuslib":
+            # libopus takes a c_char_p, which only accepts bytes.
+            payload = bytes(payload)
+        pcm = await self._handle_opus_payload(payload)
+        if pcm is None:
+            # ffmpeg-backed opus path uses encoded queue + decoder timestamps
+            if self._opus_backend == "ffmpeg":
+                await self._handle_encoded_payload(payload, codec="opus", server_ts_us=server_ts_us)
             return
+        await self._enqueue_pcm(pcm, server_ts_us=server_ts_us)
 
-        if self._stream_codec == "flac":
-            await self._handle_encoded_payload(payload_bytes, codec="flac", server_ts_us=server_ts_us)
+    async def _route_flac(self, payload: bytes, server_ts_us: int) -> None:
+        if self._flac_backend == "pyav":
+            pcm = await self._handle_flac_payload(payload)
+            if pcm:
+                await self._enqueue_pcm(pcm, server_ts_us=server_ts_us)
             return
+        await self._handle_encoded_payload(payload, codec="flac", server_ts_us=server_ts_us)
 
     async def shutdown(self) -> None:
         """Best-effort shutdown of the pipeline."""
         await self.stop_stream(reason="shutdown")
+        await self._discard_spare_mpv()
 
     # ---------------------------------------------------------------------
     # stream/clear implementation (Option A)
     # ---------------------------------------------------------------------
 
     @staticmethod
-    def _drain_queue(q: asyncio.Queue) -> None:
-        """Best-effort drain of an asyncio.Queue without blocking."""
-        try:
-            while True:
-                q.get_nowait()
-        except asyncio.QueueEmpty:
-            return
+    def _drain_queue(q: _ChunkFifo) -> None:
+        """Drop all queued items in place (the queue object is kept)."""
+        q.clear()
 
     async def _clear_buffer_locked(self) -> None:
         """Clear buffered audio without restarting mpv/decoder.
@@ -341,7 +475,7 @@ class SendspinPlayerPipeline:
     # Timestamp extraction / scheduling
     # ---------------------------------------------------------------------
 
-    def _extract_and_validate_binary_frame(self, frame: bytes) -> Tuple[int, int, bytes]:
+    def _extract_and_validate_binary_frame(self, frame: bytes) -> Tuple[int, int, Any]:
         """
         Extract and validate a binary frame according to the Sendspin spec.
 
@@ -357,7 +491,7 @@ class SendspinPlayerPipeline:
             Tuple of (msg_type, server_ts_us, payload_bytes)
             - msg_type: -1 if invalid/non-player message, otherwise the message type
             - server_ts_us: 0 if not present or invalid
-            - payload_bytes: empty bytes if invalid
+            - payload_bytes: memoryview over the frame payload (empty bytes if invalid)
 
         Per spec: "Binary messages should be rejected if there is no active stream."
         This check is done in handle_binary_frame before calling this method.
@@ -366,11 +500,11 @@ class SendspinPlayerPipeline:
             # Frame too short to contain header
             return -1, 0, b""
 
-        msg_type = frame[0]
+        msg_type, ts = _BINARY_HEADER.unpack_from(frame)
 
         # Validate message type is in player role range (4-7)
         # Per spec: Player role uses binary message IDs 4-7 (0b000001xx)
-        if msg_type < _PLAYER_MSG_TYPE_MIN or msg_type > _PLAYER_MSG_TYPE_MAX:
+        if (msg_type & _PLAYER_MSG_TYPE_MASK) != _PLAYER_MSG_TYPE_MIN:
             self._invalid_msg_type_count += 1
             if self._invalid_msg_type_count == 1 or (self._invalid_msg_type_count % 100) == 0:
                 _LOGGER.debug(
@@ -380,13 +514,8 @@ class SendspinPlayerPipeline:
                 )
             return -1, 0, b""
 
-        # Extract timestamp (big-endian signed int64 per spec)
-        try:
-            ts = int.from_bytes(frame[1:9], byteorder="big", signed=True)
-        except Exception:
-            ts = 0
-
-        payload = frame[_BINARY_HEADER_LEN:]
+        # Zero-copy view of the payload (consumers accept any bytes-like object).
+        payload = memoryview(frame)[_BINARY_HEADER_LEN:]
         return msg_type, ts, payload
 
     @staticmethod
@@ -404,10 +533,7 @@ class SendspinPlayerPipeline:
         """
         if len(frame) <= _BINARY_HEADER_LEN:
             return 0, b""
-        try:
-            ts = int.from_bytes(frame[1:9], byteorder="big", signed=True)
-        except Exception:
-            ts = 0
+        _msg_type, ts = _BINARY_HEADER.unpack_from(frame)
         payload = frame[_BINARY_HEADER_LEN:]
         return ts, payload
 
@@ -480,12 +606,12 @@ class SendspinPlayerPipeline:
             return
 
         self._pcm_frame_count += 1
-        self._pcm_last_frame_at = time.monotonic()
+        self._pcm_last_frame_at = self._mono()
         if self._pcm_first_frame_at is None:
             self._pcm_first_frame_at = self._pcm_last_frame_at
             _LOGGER.info("Sendspin: first PCM frame received (%d bytes)", len(pcm))
 
-        if (self._pcm_frame_count % 500) == 0:
+        if (self._pcm_frame_count & _FRAME_LOG_MASK) == 0:
             _LOGGER.debug(
                 "Sendspin: PCM frames received=%d (last_chunk=%d bytes)",
                 self._pcm_frame_count,
@@ -506,60 +632,123 @@ class SendspinPlayerPipeline:
     def _sanitize_id(s: str) -> str:
         return re.sub(r"[^a-zA-Z0-9_.-]+", "_", s)[:80]
 
-    async def _mpv_ipc_send(self, payload: dict) -> None:
+    async def _mpv_ipc_send(self, data: bytes) -> None:
+        """Send pre-encoded IPC command(s) over the persistent mpv connection."""
         path = self._mpv_ipc_path
         if not path:
             return
-        data = (json.dumps(payload) + "\n").encode("utf-8")
         try:
-            _reader, writer = await asyncio.open_unix_connection(path)
+            writer = self._mpv_ipc_writer
+            if writer is None or writer.is_closing():
+                writer = await self._open_mpv_ipc(path)
             writer.write(data)
             await writer.drain()
-            writer.close()
-            try:
-                await writer.wait_closed()
-            except Exception:
-                pass
         except Exception:
             _LOGGER.debug("Sendspin: mpv IPC send failed", exc_info=True)
+            await self._close_mpv_ipc()
+
+    async def _open_mpv_ipc(self, path: str) -> asyncio.StreamWriter:
+        reader, writer = await asyncio.open_unix_connection(path)
+        self._mpv_ipc_writer = writer
+        self._mpv_ipc_reader_task = self._loop.create_task(self._mpv_ipc_reader_loop(reader))
+        return writer
+
+    async def _mpv_ipc_reader_loop(self, reader: asyncio.StreamReader) -> None:
+        """Discard mpv replies/events so the persistent socket never backs up."""
+        try:
+            while await reader.read(4096):
+                pass
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            pass
+
+    async def _close_mpv_ipc(self) -> None:
+        writer = self._mpv_ipc_writer
+        self._mpv_ipc_writer = None
+
+        if self._mpv_ipc_reader_task:
+            self._mpv_ipc_reader_task.cancel()
+        self._mpv_ipc_reader_task = None
+
+        if writer is None:
+            return
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
 
     async def _wait_for_mpv_ipc(self, *, timeout_s: float = 1.5) -> bool:
+        """Connect to mpv's IPC socket, retrying with a short exponential backoff.
+
+        The successful connection becomes the persistent IPC connection, so
+        readiness costs a single connect once mpv is listening.
+        """
         path = self._mpv_ipc_path
         if not path:
             return False
-        deadline = time.monotonic() + max(0.2, timeout_s)
-        while time.monotonic() < deadline and not self._stop_event.is_set():
-            if os.path.exists(path):
+        writer = self._mpv_ipc_writer
+        if writer is not None and not writer.is_closing():
+            return True
+
+        deadline = self._mono() + max(0.2, timeout_s)
+        delay = 0.005
+        while not self._stop_event.is_set():
+            try:
+                await self._open_mpv_ipc(path)
                 return True
-            await asyncio.sleep(0.05)
-        return os.path.exists(path)
+            except OSError:
+                # Socket not created yet (ENOENT) or not listening yet (ECONNREFUSED).
+                pass
+            if self._mono() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return False
+
+    def _request_audio_apply(self) -> None:
+        """Wake the audio applier; it sends whatever state is current."""
+        self._audio_state_event.set()
+
+    async def _audio_applier_loop(self) -> None:
+        try:
+            while self._stream_active:
+                await self._audio_state_event.wait()
+                # Let a burst of updates settle before sending the latest.
+                await asyncio.sleep(_AUDIO_APPLY_DEBOUNCE_S)
+                self._audio_state_event.clear()
+                await self._apply_mpv_audio_state()
+        except asyncio.CancelledError:
+            return
 
     async def _apply_mpv_audio_state(self) -> None:
-        async with self._mpv_ipc_lock:
-            if not self._mpv_ipc_path or not self._stream_active:
-                return
+        if not self._mpv_ipc_path or not self._stream_active:
+            return
 
-            for attempt in range(6):
-                if not self._mpv_ipc_ready:
-                    self._mpv_ipc_ready = await self._wait_for_mpv_ipc(timeout_s=0.5)
+        for attempt in range(6):
+            if not self._mpv_ipc_ready:
+                self._mpv_ipc_ready = await self._wait_for_mpv_ipc(timeout_s=0.5)
 
-                if self._mpv_ipc_ready:
-                    break
+            if self._mpv_ipc_ready:
+                break
 
-                if attempt == 5:
-                    _LOGGER.debug("Sendspin: mpv IPC not ready after retries (%s)", self._mpv_ipc_path)
-                    return
+            if attempt == 5:
+                _LOGGER.debug("Sendspin: mpv IPC not ready after retries (%s)", self._mpv_ipc_path)
+                return
 
-                await asyncio.sleep(0.1)
+            await asyncio.sleep(0.1)
 
-            await self._mpv_ipc_send({"command": ["set_property", "mute", bool(self._muted)]})
-            await self._mpv_ipc_send({"command": ["set_property", "volume", int(self._effective_volume)]})
+        # Both properties in one write/drain.
+        await self._mpv_ipc_send(
+            _MPV_IPC_MUTE[bool(self._muted)] + _MPV_IPC_VOLUME % int(self._effective_volume)
+        )
 
-            _LOGGER.debug(
-                "Sendspin: applied mpv audio state (muted=%s eff_vol=%s)",
-                self._muted,
-                self._effective_volume,
-            )
+        _LOGGER.debug(
+            "Sendspin: applied mpv audio state (muted=%s eff_vol=%s)",
+            self._muted,
+            self._effective_volume,
+        )
 
     # ---------------------------------------------------------------------
     # Stream start/stop
@@ -578,6 +767,7 @@ class SendspinPlayerPipeline:
             await self._stop_stream(reason="restart")
 
         self._stream_codec = (codec or "pcm").lower()
+        self._codec_id = _CODEC_IDS.get(self._stream_codec, -1)
         self._stream_rate = int(sample_rate or 48000)
         self._stream_channels = int(channels or 2)
         self._stream_bit_depth = int(bit_depth or 16)
@@ -589,9 +779,9 @@ class SendspinPlayerPipeline:
         self._pcm_last_frame_at = None
         self._sink_failed = False
 
-        # Reset queues / timestamp mapping
-        self._pcm_queue = asyncio.Queue(maxsize=500)
-        self._encoded_queue = asyncio.Queue(maxsize=400)
+        # Reset queues / timestamp mapping (in place; tasks keep valid references)
+        self._drain_queue(self._pcm_queue)
+        self._drain_queue(self._encoded_queue)
         self._encoded_ts_queue.clear()
         self._decoder_due_us = None
         self._decoder_due_frac = 0.0
@@ -602,17 +792,8 @@ class SendspinPlayerPipeline:
         self._clear_drop_until_us = 0
         self._clear_cutoff_due_us = 0
 
-        # mpv IPC socket path
-        sock_id = self._sanitize_id(self._client_id)
-        self._mpv_ipc_path = f"/tmp/lva_sendspin_mpv_{sock_id}.sock"
+        # Spawn PCM sink (mpv); also selects the mpv IPC socket path.
         self._mpv_ipc_ready = False
-        try:
-            if self._mpv_ipc_path and os.path.exists(self._mpv_ipc_path):
-                os.remove(self._mpv_ipc_path)
-        except Exception:
-            pass
-
-        # Spawn PCM sink (mpv)
         await self._spawn_pcm_sink_mpv(
             sample_rate=self._stream_rate,
             channels=self._stream_channels,
@@ -623,12 +804,19 @@ class SendspinPlayerPipeline:
 
         # Start decoder for non-PCM codecs
         if self._stream_codec == "flac":
-            await self._start_ffmpeg_decoder(input_codec="flac")
+            await self._select_flac_backend()
         elif self._stream_codec == "opus":
             await self._select_opus_backend()
 
         # Apply current audio state as soon as mpv IPC is available.
-        self._loop.create_task(self._apply_mpv_audio_state())
+        self._audio_apply_task = self._loop.create_task(self._audio_applier_loop())
+        self._request_audio_apply()
+
+        # Warm up a spare sink for the next start (pause/resume, seeks, restarts).
+        if self._mpv_prespawn and self._spare_task is None and self._spare_pcm_proc is None:
+            self._spare_task = self._loop.create_task(
+                self._prespawn_spare_mpv((self._stream_rate, self._stream_channels, self._stream_bit_depth))
+            )
 
         _LOGGER.info(
             "Sendspin: stream start codec=%s rate=%s ch=%s depth=%s (sync_latency_ms=%d output_latency_ms=%d late_drop_ms=%d)",
@@ -653,6 +841,10 @@ class SendspinPlayerPipeline:
         await self._stop_decoder()
 
         # Stop PCM sink
+        if self._audio_apply_task:
+            self._audio_apply_task.cancel()
+        self._audio_apply_task = None
+        await self._close_mpv_ipc()
         await self._stop_pcm_sink()
 
         # Clear IPC socket
@@ -672,12 +864,43 @@ class SendspinPlayerPipeline:
     # mpv raw PCM sink
     # ---------------------------------------------------------------------
 
+    def _mpv_ipc_slot_path(self, slot: int) -> str:
+        sock_id = self._sanitize_id(self._client_id)
+        return f"/tmp/lva_sendspin_mpv_{sock_id}_{int(slot)}.sock"
+
     async def _spawn_pcm_sink_mpv(self, *, sample_rate: int, channels: int, bit_depth: int) -> None:
+        key = (int(sample_rate), int(channels), int(bit_depth))
+
+        spare = await self._take_spare_mpv(key)
+        if spare is not None:
+            self._pcm_proc, self._mpv_ipc_path = spare
+            _LOGGER.debug("Sendspin: using pre-spawned mpv sink (%s)", self._mpv_ipc_path)
+        else:
+            # Use the slot the spare isn't holding.
+            path = self._mpv_ipc_slot_path(0)
+            if path == self._spare_ipc_path:
+                path = self._mpv_ipc_slot_path(1)
+            self._mpv_ipc_path = path
+            self._pcm_proc = await self._exec_pcm_sink_mpv(key, path)
+
+        self._pcm_writer_task = self._loop.create_task(self._pcm_writer_loop())
+        self._pcm_stderr_task = self._loop.create_task(self._stderr_reader_loop(self._pcm_proc, name="mpv"))
+        self._pcm_wait_task = self._loop.create_task(self._pcm_wait_loop())
+
+    async def _exec_pcm_sink_mpv(self, key: Tuple[int, int, int], ipc_path: str) -> asyncio.subprocess.Process:
+        sample_rate, channels, bit_depth = key
+
         mpv_path = shutil.which("mpv")
         if not mpv_path:
             raise RuntimeError("mpv not found in PATH")
 
-        fmt = "s16le" if int(bit_depth) == 16 else "s32le"
+        try:
+            if os.path.exists(ipc_path):
+                os.remove(ipc_path)
+        except Exception:
+            pass
+
+        fmt = self._FMT_BY_DEPTH.get(int(bit_depth), "s16le")
 
         args = [
             mpv_path,
@@ -689,20 +912,87 @@ class SendspinPlayerPipeline:
             f"--demuxer-rawaudio-format={fmt}",
             f"--demuxer-rawaudio-rate={int(sample_rate)}",
             f"--demuxer-rawaudio-channels={int(channels)}",
-            f"--input-ipc-server={self._mpv_ipc_path}",
+            f"--input-ipc-server={ipc_path}",
             "fd://0",
         ]
 
-        self._pcm_proc = await asyncio.create_subprocess_exec(
+        return await asyncio.create_subprocess_exec(
             *args,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
 
-        self._pcm_writer_task = self._loop.create_task(self._pcm_writer_loop())
-        self._pcm_stderr_task = self._loop.create_task(self._stderr_reader_loop(self._pcm_proc, name="mpv"))
-        self._pcm_wait_task = self._loop.create_task(self._pcm_wait_loop())
+    async def _prespawn_spare_mpv(self, key: Tuple[int, int, int]) -> None:
+        path = self._mpv_ipc_slot_path(1)
+        if path == self._mpv_ipc_path:
+            path = self._mpv_ipc_slot_path(0)
+        try:
+            proc = await self._exec_pcm_sink_mpv(key, path)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _LOGGER.debug("Sendspin: spare mpv spawn failed", exc_info=True)
+            return
+        self._spare_pcm_proc = proc
+        self._spare_pcm_key = key
+        self._spare_ipc_path = path
+
+    async def _take_spare_mpv(self, key: Tuple[int, int, int]) -> Optional[Tuple[asyncio.subprocess.Process, str]]:
+        """Hand over the warm spare if it matches `key`; otherwise discard it."""
+        task = self._spare_task
+        self._spare_task = None
+        if task is not None:
+            # Still spawning: waiting for it is cheaper than a fresh cold start.
+            await asyncio.wait({task})
+
+        proc = self._spare_pcm_proc
+        if proc is None:
+            return None
+
+        if self._spare_pcm_key != key or proc.returncode is not None or not self._spare_ipc_path:
+            await self._discard_spare_mpv()
+            return None
+
+        path = self._spare_ipc_path
+        self._spare_pcm_proc = None
+        self._spare_pcm_key = None
+        self._spare_ipc_path = None
+        return proc, path
+
+    async def _discard_spare_mpv(self) -> None:
+        task = self._spare_task
+        self._spare_task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.wait({task})
+
+        proc = self._spare_pcm_proc
+        path = self._spare_ipc_path
+        self._spare_pcm_proc = None
+        self._spare_pcm_key = None
+        self._spare_ipc_path = None
+
+        if proc is not None:
+            try:
+                if proc.stdin:
+                    proc.stdin.close()
+                proc.terminate()
+            except Exception:
+                pass
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except Exception:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
+        try:
+            if path and os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
 
     async def _stop_pcm_sink(self) -> None:
         proc = self._pcm_proc
@@ -750,6 +1040,11 @@ class SendspinPlayerPipeline:
         proc = self._pcm_proc
         assert proc.stdin is not None
 
+        # Write straight to the (non-blocking) pipe fd, skipping the
+        # StreamWriter/transport layers. Fall back to the writer if the
+        # transport doesn't expose the pipe.
+        fd = self._pipe_fileno(proc.stdin)
+
         try:
             while not self._stop_event.is_set():
                 epoch, due_us, chunk = await self._pcm_queue.get()
@@ -774,12 +1069,19 @@ class SendspinPlayerPipeline:
                 if int(epoch) != int(self._clear_epoch):
                     continue
 
+                # Coalesce any following chunks that are already due into one
+                # write/drain instead of one syscall round-trip per packet.
+                chunk = self._coalesce_due_pcm(int(epoch), chunk)
+
                 try:
                     # Re-check epoch right before write to reduce race window.
                     if int(epoch) != int(self._clear_epoch):
                         continue
-                    proc.stdin.write(chunk)
-                    await proc.stdin.drain()
+                    if fd is not None:
+                        await self._write_fd(fd, chunk)
+                    else:
+                        proc.stdin.write(chunk)
+                        await proc.stdin.drain()
                 except (BrokenPipeError, ConnectionResetError):
                     raise
                 except Exception:
@@ -792,6 +1094,65 @@ class SendspinPlayerPipeline:
             _LOGGER.warning("Sendspin: PCM writer failed")
             self._sink_failed = True
 
+    @staticmethod
+    def _pipe_fileno(stream: asyncio.StreamWriter) -> Optional[int]:
+        try:
+            pipe = stream.transport.get_extra_info("pipe")
+            return int(pipe.fileno()) if pipe is not None else None
+        except Exception:
+            return None
+
+    async def _write_fd(self, fd: int, data: bytes) -> None:
+        """Write all of `data` to a non-blocking fd, waiting for writability on EAGAIN."""
+        view = memoryview(data)
+        while view:
+            try:
+                n = os.write(fd, view)
+            except BlockingIOError:
+                n = 0
+            view = view[n:]
+            if not view:
+                return
+
+            fut = self._loop.create_future()
+
+            def _on_writable() -> None:
+                if not fut.done():
+                    fut.set_result(None)
+
+            self._loop.add_writer(fd, _on_writable)
+            try:
+                await fut
+            finally:
+                self._loop.remove_writer(fd)
+
+    def _coalesce_due_pcm(self, epoch: int, chunk: bytes) -> bytes:
+        """Append queued same-epoch chunks whose due time has already passed.
+
+        Stops at the first chunk that is not yet due (pacing is preserved) or
+        once `_PCM_COALESCE_MAX_BYTES` is reached. Chunks that are past the
+        late-drop threshold are discarded, matching the writer loop.
+        """
+        queue = self._pcm_queue
+        nxt = queue.peek_nowait()
+        if nxt is None:
+            return chunk
+
+        parts = [chunk]
+        size = len(chunk)
+        now_us = _now_us()
+        while nxt is not None and size < _PCM_COALESCE_MAX_BYTES:
+            nxt_epoch, nxt_due_us, nxt_chunk = nxt
+            if nxt_epoch != epoch or nxt_due_us > now_us:
+                break
+            queue.get_nowait()
+            if nxt_chunk and nxt_due_us + self._sync_late_drop_us >= now_us:
+                parts.append(nxt_chunk)
+                size += len(nxt_chunk)
+            nxt = queue.peek_nowait()
+
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
     async def _pcm_wait_loop(self) -> None:
         proc = self._pcm_proc
         if not proc:
@@ -800,7 +1161,7 @@ class SendspinPlayerPipeline:
         try:
             rc = await proc.wait()
             if self._stream_active:
-                tail = "".join(list(self._mpv_stderr_tail))
+                tail = "\n".join(x.decode("utf-8", errors="replace") for x in list(self._mpv_stderr_tail))
                 _LOGGER.warning("Sendspin: mpv exited unexpectedly rc=%s tail=%s", rc, tail)
                 self._sink_failed = True
         except asyncio.CancelledError:
@@ -811,16 +1172,17 @@ class SendspinPlayerPipeline:
     async def _stderr_reader_loop(self, proc: asyncio.subprocess.Process, *, name: str) -> None:
         if not proc or not proc.stderr:
             return
+        keep_tail = name == "mpv"
         try:
             while not self._stop_event.is_set():
                 line = await proc.stderr.readline()
                 if not line:
                     break
-                txt = line.decode("utf-8", errors="replace").rstrip()
-                if name == "mpv":
-                    self._mpv_stderr_tail.append(txt + "\n")
-                if txt:
-                    _LOGGER.debug("Sendspin: %s stderr: %s", name, txt)
+                line = line.rstrip()
+                if keep_tail:
+                    self._mpv_stderr_tail.append(line)
+                if line and _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sendspin: %s stderr: %s", name, line.decode("utf-8", errors="replace"))
         except asyncio.CancelledError:
             return
         except Exception:
@@ -836,7 +1198,14 @@ class SendspinPlayerPipeline:
                 import opuslib  # type: ignore
 
                 self._opus_decoder = opuslib.Decoder(self._stream_rate, self._stream_channels)
-                self._opus_max_frame_size = int(self._stream_rate * 0.12)  # 120ms
+                # Size for the common case (20 ms @ 48 kHz, else 60 ms); grown to
+                # the 120 ms Opus maximum on the first larger packet.
+                if self._stream_rate == 48000:
+                    self._opus_max_frame_size = 960
+                else:
+                    self._opus_max_frame_size = int(self._stream_rate * 0.06)
+                self._opus_decode_fn = opuslib.api.decoder.libopus_decode
+                self._opus_pcm_buf = (ctypes.c_int16 * (self._opus_max_frame_size * self._stream_channels))()
                 self._opus_backend = "opuslib"
                 _LOGGER.info("Sendspin: opus decode backend=opuslib")
                 return
@@ -852,10 +1221,28 @@ class SendspinPlayerPipeline:
         self._opus_backend = "none"
         _LOGGER.warning("Sendspin: no Opus decode backend available; dropping audio")
 
+    async def _select_flac_backend(self) -> None:
+        if self._pyav_available and self._decoder_backend != "ffmpeg":
+            try:
+                import av  # type: ignore
+
+                self._flac_ctx = av.CodecContext.create("flac", "r")
+                self._flac_backend = "pyav"
+                _LOGGER.info("Sendspin: flac decode backend=pyav")
+                return
+            except Exception:
+                _LOGGER.debug("Sendspin: PyAV flac init failed", exc_info=True)
+
+        await self._start_ffmpeg_decoder(input_codec="flac")
+        self._flac_backend = "ffmpeg"
+        _LOGGER.info("Sendspin: flac decode backend=ffmpeg")
+
     async def _start_ffmpeg_decoder(self, *, input_codec: str) -> None:
         if not self._ffmpeg_available:
             raise RuntimeError("ffmpeg not available")
 
+        out_fmt = "s24le" if int(self._stream_bit_depth) == 24 else "s16le"
+
         args = [
             self._ffmpeg_path,
             "-hide_banner",
@@ -864,9 +1251,9 @@ class SendspinPlayerPipeline:
             "-i",
             "pipe:0",
             "-f",
-            "s16le",
+            out_fmt,
             "-acodec",
-            "pcm_s16le",
+            f"pcm_{out_fmt}",
             "-ac",
             str(self._stream_channels),
             "-ar",
@@ -874,31 +1261,63 @@ class SendspinPlayerPipeline:
             "pipe:1",
         ]
 
-        self._decoder_proc = await asyncio.create_subprocess_exec(
-            *args,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        read_fd, write_fd = os.pipe()
+        try:
+            self._decoder_proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.PIPE if self._debug_stderr else asyncio.subprocess.DEVNULL,
+            )
+        except Exception:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        os.set_blocking(read_fd, False)
+        self._decoder_stdout_fd = read_fd
 
-        self._decoder_writer_task = self._loop.create_task(self._decoder_writer_loop())
-        self._decoder_reader_task = self._loop.create_task(self._decoder_reader_loop())
-        self._decoder_stderr_task = self._loop.create_task(self._stderr_reader_loop(self._decoder_proc, name="ffmpeg"))
+        self._decoder_task = self._loop.create_task(self._decoder_supervisor_loop(self._decoder_proc))
+
+    async def _decoder_supervisor_loop(self, proc: asyncio.subprocess.Process) -> None:
+        """Run the decoder loops together; cancelling this task cancels all of them.
+
+        (asyncio.TaskGroup would be the natural fit, but it requires Python 3.11.)
+        """
+        loops = [self._decoder_writer_loop(), self._decoder_reader_loop()]
+        if self._debug_stderr:
+            loops.append(self._stderr_reader_loop(proc, name="ffmpeg"))
+        try:
+            await asyncio.gather(*loops)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            _LOGGER.debug("Sendspin: decoder supervisor error", exc_info=True)
 
     async def _stop_decoder(self) -> None:
         proc = self._decoder_proc
         self._decoder_proc = None
 
-        for t in (self._decoder_writer_task, self._decoder_reader_task, self._decoder_stderr_task):
-            if t:
-                t.cancel()
+        if self._decoder_task:
+            self._decoder_task.cancel()
+        self._decoder_task = None
 
-        self._decoder_writer_task = None
-        self._decoder_reader_task = None
-        self._decoder_stderr_task = None
+        fd = self._decoder_stdout_fd
+        self._decoder_stdout_fd = None
+        if fd is not None:
+            self._loop.remove_reader(fd)
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
         self._opus_decoder = None
+        self._opus_decode_fn = None
+        self._opus_pcm_buf = None
         self._opus_backend = "none"
+        self._flac_ctx = None
+        self._flac_backend = "none"
 
         if not proc:
             return
@@ -960,7 +1379,13 @@ class SendspinPlayerPipeline:
             _LOGGER.warning("Sendspin: decoder writer failed")
 
     def _pcm_bytes_to_duration_us(self, pcm_bytes: int) -> float:
-        bps = 2 if int(self._stream_bit_depth) == 16 else 4
+        bit_depth = int(self._stream_bit_depth)
+        if bit_depth == 16:
+            bps = 2
+        elif bit_depth == 24:
+            bps = 3
+        else:
+            bps = 4
         frame_bytes = bps * max(1, int(self._stream_channels))
         if frame_bytes <= 0:
             return 0.0
@@ -968,14 +1393,35 @@ class SendspinPlayerPipeline:
         rate = float(max(1, int(self._stream_rate)))
         return (samples / rate) * 1_000_000.0
 
+    async def _read_fd(self, fd: int, size: int) -> bytes:
+        """Read up to `size` bytes from a non-blocking fd, waiting for readability."""
+        while True:
+            try:
+                return os.read(fd, size)
+            except BlockingIOError:
+                pass
+
+            fut = self._loop.create_future()
+
+            def _on_readable() -> None:
+                if not fut.done():
+                    fut.set_result(None)
+
+            self._loop.add_reader(fd, _on_readable)
+            try:
+                await fut
+            finally:
+                self._loop.remove_reader(fd)
+
     async def _decoder_reader_loop(self) -> None:
         proc = self._decoder_proc
-        if not proc or not proc.stdout:
+        fd = self._decoder_stdout_fd
+        if not proc or fd is None:
             return
 
         try:
             while not self._stop_event.is_set() and self._stream_active:
-                chunk = await proc.stdout.read(8192)
+                chunk = await self._read_fd(fd, _DECODER_READ_SIZE)
                 if not chunk:
                     break
 
@@ -1044,14 +1490,75 @@ class SendspinPlayerPipeline:
         except asyncio.QueueFull:
             _LOGGER.debug("Sendspin: encoded queue full; dropping %s payload (%d bytes)", codec, len(payload))
 
+    def _decode_flac_sync(self, payload: bytes) -> bytes:
+        """Decode one FLAC frame with the persistent PyAV codec context (blocking)."""
+        import av  # type: ignore
+
+        ctx = self._flac_ctx
+        if ctx is None:
+            return b""
+
+        out = []
+        for frame in ctx.decode(av.packet.Packet(payload)):
+            arr = frame.to_ndarray()
+            if frame.format.is_planar:
+                # (channels, samples) -> interleaved
+                arr = arr.T
+            if arr.dtype == np.int32 and int(self._stream_bit_depth) == 24:
+                out.append(self._pack_24bit(arr.tobytes()))
+            else:
+                out.append(arr.tobytes())
+        return b"".join(out)
+
+    @staticmethod
+    def _pack_24bit(pcm_s32: bytes) -> bytes:
+        """Pack left-justified s32le samples (libavcodec's 24-bit layout) into s24le.
+
+        The top three bytes of each little-endian int32 carry the 24-bit sample.
+        """
+        return np.frombuffer(pcm_s32, dtype="<i4").view(np.uint8).reshape(-1, 4)[:, 1:].tobytes()
+
+    async def _handle_flac_payload(self, payload: bytes) -> Optional[bytes]:
+        if self._flac_ctx is None:
+            return None
+        try:
+            return await self._loop.run_in_executor(None, self._decode_flac_sync, payload)
+        except Exception:
+            _LOGGER.debug("Sendspin: PyAV flac decode failed", exc_info=True)
+            return None
+
     async def _handle_opus_payload(self, payload: bytes) -> Optional[bytes]:
         if self._opus_backend == "none":
             return None
 
         if self._opus_backend == "opuslib" and self._opus_decoder is not None:
             try:
-                pcm = self._opus_decoder.decode(payload, self._opus_max_frame_size, decode_fec=False)
-                return pcm
+                buf = self._opus_pcm_buf
+                samples = self._opus_decode_fn(
+                    self._opus_decoder.decoder_state,
+                    payload,
+                    len(payload),
+                    buf,
+                    self._opus_max_frame_size,
+                    0,
+                )
+                if samples == _OPUS_BUFFER_TOO_SMALL and self._opus_max_frame_size < int(self._stream_rate * 0.12):
+                    self._opus_max_frame_size = int(self._stream_rate * 0.12)  # 120ms
+                    buf = self._opus_pcm_buf = (ctypes.c_int16 * (self._opus_max_frame_size * self._stream_channels))()
+                    _LOGGER.debug("Sendspin: opus packet larger than expected; frame buffer grown to 120ms")
+                    samples = self._opus_decode_fn(
+                        self._opus_decoder.decoder_state,
+                        payload,
+                        len(payload),
+                        buf,
+                        self._opus_max_frame_size,
+                        0,
+                    )
+                if samples < 0:
+                    _LOGGER.debug("Sendspin: opuslib decode failed (error=%d)", samples)
+                    return None
+                # One copy out of the reusable buffer (2 bytes per s16 sample).
+                return ctypes.string_at(buf, samples * self._stream_channels * 2)
             except Exception:
                 _LOGGER.debug("Sendspin: opuslib decode failed", exc_info=True)
                 return None
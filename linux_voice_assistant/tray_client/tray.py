@@ -0,0 +1,560 @@
+"""
+System tray icon for the LVA Tray Client.
+
+Kept apart from client.py so the PyQt5 widget stack is only imported once
+the command line and config have been handled.
+"""
+
+import functools
+import json
+import logging
+import queue
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import paho.mqtt.client as mqtt
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+try:
+    from PyQt5 import QtSvg
+except ImportError:  # e.g. Debian without python3-pyqt5.qtsvg
+    QtSvg = None
+
+from linux_voice_assistant.config import Config
+from linux_voice_assistant.models import SatelliteState
+from linux_voice_assistant.util import slugify_device_id
+
+_json_loads: Callable[[bytes], Any]
+try:
+    # C parser; accepts the raw MQTT payload bytes directly
+    from orjson import loads as _orjson_loads
+
+    _json_loads = _orjson_loads
+except ImportError:
+    _json_loads = json.loads
+
+_LOGGER = logging.getLogger("lva_tray_client")
+
+RGB = Tuple[int, int, int]
+
+_OFFLINE_RGB: RGB = (128, 128, 128)
+
+# Light-state payloads exactly as MqttController publishes them
+# ({"state", "color_mode", "brightness", "color": {"r", "g", "b"}}); anything
+# else falls back to a full JSON parse.
+_FAST_LIGHT_RE = re.compile(
+    rb'"state"\s*:\s*"(ON|OFF)".*?"brightness"\s*:\s*(\d+)'
+    rb'.*?"color"\s*:\s*\{\s*"r"\s*:\s*(\d+)\s*,\s*"g"\s*:\s*(\d+)\s*,\s*"b"\s*:\s*(\d+)\s*\}',
+    re.DOTALL,
+)
+
+# MQTT updates arriving within this window are folded into a single redraw
+_UPDATE_COALESCE_MS = 50
+
+# After a fresh subscribe, hold redraws this long so the retained replay
+# (availability, mute and every light state) renders once
+_SUBSCRIBE_SETTLE_MS = 200
+
+# _SCALE_LUT[brightness, channel] == channel * brightness // 255, so scaling a
+# color by its brightness is one integer gather instead of float math per call
+_SCALE_LUT = (
+    np.arange(256, dtype=np.uint16)[:, None] * np.arange(256, dtype=np.uint16)[None, :] // 255
+).astype(np.uint8)
+
+_TINT_SCALE = np.array((1.0, 0.4, 0.4))
+_TINT_OFFSET = np.array((120.0, 0.0, 0.0))
+
+
+def _muted_tint(rgb: np.ndarray) -> np.ndarray:
+    """Tint ``rgb`` red (but keep some info from the base color)."""
+    tinted: np.ndarray = np.minimum(rgb * _TINT_SCALE + _TINT_OFFSET, 255)
+    return tinted.astype(np.uint8)
+
+
+_ICON_SIZE = 20
+
+
+@functools.lru_cache(maxsize=1)
+def _circle_layers() -> Tuple[QtGui.QPixmap, QtGui.QPixmap]:
+    """Render the antialiased circle mask and its outline once."""
+    size = _ICON_SIZE
+    radius = size // 2 - 2
+
+    mask = QtGui.QPixmap(size, size)
+    mask.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(mask)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(QtGui.QBrush(QtCore.Qt.white))
+    painter.drawEllipse(2, 2, radius * 2, radius * 2)
+    painter.end()
+
+    outline = QtGui.QPixmap(size, size)
+    outline.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(outline)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    pen = QtGui.QPen(QtGui.QColor(0, 0, 0, 160))
+    pen.setWidth(1)
+    painter.setPen(pen)
+    painter.setBrush(QtCore.Qt.NoBrush)
+    painter.drawEllipse(2, 2, radius * 2, radius * 2)
+    painter.end()
+
+    return mask, outline
+
+
+# Same circle as the pixmap fallback below, as a 20x20 vector template
+_CIRCLE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 20 20">'
+    '<circle cx="10" cy="10" r="7.5" fill="#%02x%02x%02x" '
+    'stroke="#000000" stroke-opacity="0.63" stroke-width="1"/></svg>'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _circle_icon(rgb: RGB) -> QtGui.QIcon:
+    """Return the round tray icon filled with ``rgb`` (cached per color).
+
+    Must only be called from the GUI thread; QPixmap is not thread-safe.
+    """
+    if QtSvg is not None:
+        return _svg_circle_icon(rgb)
+    return _mask_circle_icon(rgb)
+
+
+def _svg_circle_icon(rgb: RGB) -> QtGui.QIcon:
+    """Render the SVG circle at the style's small icon size and at 2x.
+
+    QIcon picks the closest pixmap for the screen's device pixel ratio, so
+    HiDPI trays get a sharp icon instead of an upscaled 20px raster.
+    """
+    renderer = QtSvg.QSvgRenderer(QtCore.QByteArray((_CIRCLE_SVG % rgb).encode()))
+    size = QtWidgets.QApplication.style().pixelMetric(QtWidgets.QStyle.PM_SmallIconSize)
+
+    icon = QtGui.QIcon()
+    for scale in (1, 2):
+        pixmap = QtGui.QPixmap(size * scale, size * scale)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        icon.addPixmap(pixmap)
+    return icon
+
+
+def _mask_circle_icon(rgb: RGB) -> QtGui.QIcon:
+    """Fallback without QtSvg: tint the prebuilt 20px circle mask.
+
+    Colors the prebuilt mask in place (SourceIn keeps its alpha) and lays
+    the outline over it, so no ellipse is rasterized per color.
+    """
+    mask, outline = _circle_layers()
+    pixmap = QtGui.QPixmap(mask)
+
+    painter = QtGui.QPainter(pixmap)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
+    painter.fillRect(pixmap.rect(), QtGui.QColor(*rgb))
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+    painter.drawPixmap(0, 0, outline)
+    painter.end()
+
+    return QtGui.QIcon(pixmap)
+
+
+class LvaTrayClient(QtWidgets.QSystemTrayIcon):
+    """System tray integration for the Linux Voice Assistant."""
+
+    STATES = [
+        SatelliteState.IDLE.value,
+        SatelliteState.LISTENING.value,
+        SatelliteState.THINKING.value,
+        SatelliteState.RESPONDING.value,
+        SatelliteState.ERROR.value,
+    ]
+
+    def __init__(self, app: QtWidgets.QApplication, config: Config):
+        super().__init__(parent=None)
+        self._app = app
+
+        self._config = config
+        self._device_name = config.app.name
+        self._device_id = slugify_device_id(self._device_name)
+
+        # Tray/systemd configuration
+        self._systemd_service_name = getattr(
+            getattr(config, "tray", None),
+            "systemd_service_name",
+            "linux-voice-assistant.service",
+        )
+
+        # MQTT configuration
+        mqtt_cfg = config.mqtt
+        if not mqtt_cfg.enabled or not mqtt_cfg.host:
+            raise RuntimeError(
+                "Tray client requires MQTT to be enabled and mqtt.host to be set in config.json"
+            )
+
+        self._mqtt_host = mqtt_cfg.host
+        self._mqtt_port = mqtt_cfg.port
+        self._mqtt_username = mqtt_cfg.username
+        self._mqtt_password = mqtt_cfg.password
+
+        self._topic_prefix = f"lva/{self._device_id}"
+        self._topic_availability = f"{self._topic_prefix}/availability"
+        self._topic_mute_state = f"{self._topic_prefix}/mute/state"
+        self._topic_mute_set = f"{self._topic_prefix}/mute/set"
+
+        # Exact light-state topic -> state name; subscribed to explicitly so the
+        # broker filters instead of us pattern-matching everything under the prefix.
+        self._light_topic_to_state: Dict[str, str] = {
+            f"{self._topic_prefix}/{state}_light/state": state for state in self.STATES
+        }
+
+        # Last raw payload per light topic; retained replays are usually identical
+        self._last_light_payload: Dict[str, bytes] = {}
+
+        # (state_name, payload) handed from the paho thread to the GUI thread,
+        # which parses them in _flush_update so the network loop never blocks
+        self._light_updates: "queue.SimpleQueue[Tuple[str, bytes]]" = queue.SimpleQueue()
+
+        # Current state
+        self._connected: bool = False  # broker link
+        self._available: bool = False  # LVA's own availability topic
+        self._muted: bool = False
+        self._current_state: str = SatelliteState.IDLE.value
+
+        # Default colors per state (fallbacks)
+        self._default_colors: Dict[str, RGB] = {
+            SatelliteState.IDLE.value: (128, 0, 255),        # purple
+            SatelliteState.LISTENING.value: (0, 0, 255),     # blue
+            SatelliteState.THINKING.value: (255, 255, 0),    # yellow
+            SatelliteState.RESPONDING.value: (0, 255, 0),    # green
+            SatelliteState.ERROR.value: (255, 165, 0),       # orange
+        }
+
+        # Last MQTT-derived color per state (idle included)
+        # as a (state, muted, rgb) table; the muted (red-tinted) column is kept
+        # in sync on update so picking a display color is a single index.
+        self._state_idx: Dict[str, int] = {state: i for i, state in enumerate(self.STATES)}
+        base = np.array([self._default_colors[state] for state in self.STATES], dtype=np.uint8)
+        self._colors_arr = np.stack((base, _muted_tint(base)), axis=1)
+
+        # (available, state, rgb, muted) last pushed to Qt; skips no-op updates
+        self._last_display_key: Optional[Tuple[bool, str, RGB, bool]] = None
+
+        # Per-attribute values last applied to Qt (each setter may emit signals)
+        self._last_muted: Optional[bool] = None
+        self._last_icon_rgb: Optional[RGB] = None
+        self._last_tip: Optional[str] = None
+
+        # Coalesced redraws: MQTT callbacks run on paho's network thread, so they
+        # only flag a pending update and start this timer on the GUI thread.
+        self._update_pending = False
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(_UPDATE_COALESCE_MS)
+        self._update_timer.timeout.connect(self._flush_update)
+
+        self._suppress_updates = False
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(_SUBSCRIBE_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._release_updates)
+
+        # Build context menu
+        self._build_menu()
+
+        # Initial icon: offline
+        self._update_tray_icon()
+
+        # MQTT setup
+        # Every connect re-subscribes: LVA publishes at QoS 0, so state changed
+        # during a blip only comes back through the retained replay.
+        self._client = mqtt.Client()
+        self._client.reconnect_delay_set(min_delay=1, max_delay=30)
+        self._client.max_inflight_messages_set(200)
+        self._client.max_queued_messages_set(0)  # unbounded
+        if self._mqtt_username:
+            self._client.username_pw_set(self._mqtt_username, self._mqtt_password)
+
+        self._client.on_connect = self._on_connect
+        self._client.on_message = self._on_message
+        self._client.on_disconnect = self._on_disconnect
+
+        # Per-topic dispatch happens inside paho; on_message only sees strays
+        self._client.message_callback_add(self._topic_availability, self._on_availability)
+        self._client.message_callback_add(self._topic_mute_state, self._on_mute_state)
+        for topic, state_name in self._light_topic_to_state.items():
+            self._client.message_callback_add(
+                topic, functools.partial(self._on_light_state, state_name)
+            )
+
+        _LOGGER.debug("MQTT connecting to %s:%s", self._mqtt_host, self._mqtt_port)
+        try:
+            self._client.connect(self._mqtt_host, self._mqtt_port, 60)
+            self._client.loop_start()
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to connect to MQTT broker")
+
+        # Show tray icon
+        self.setVisible(True)
+        _LOGGER.info("LVA Tray Client started for device_id=%s", self._device_id)
+
+    # ------------------------------------------------------------------
+    # Menu / actions
+    # ------------------------------------------------------------------
+
+    def _build_menu(self) -> None:
+        menu = QtWidgets.QMenu()
+
+        # Status label
+        self._status_action = QtWidgets.QAction("LVA Tray Client", self)
+        self._status_action.setEnabled(False)
+        menu.addAction(self._status_action)
+        menu.addSeparator()
+
+        # Service control
+        start_action = QtWidgets.QAction("Start LVA", self)
+        start_action.triggered.connect(self._start_lva)
+        menu.addAction(start_action)
+
+        stop_action = QtWidgets.QAction("Stop LVA", self)
+        stop_action.triggered.connect(self._stop_lva)
+        menu.addAction(stop_action)
+
+        restart_action = QtWidgets.QAction("Restart LVA", self)
+        restart_action.triggered.connect(self._restart_lva)
+        menu.addAction(restart_action)
+
+        menu.addSeparator()
+
+        # Mute toggle
+        self._mute_action = QtWidgets.QAction("Mute Microphone", self)
+        self._mute_action.setCheckable(True)
+        self._mute_action.triggered.connect(self._toggle_mute)
+        menu.addAction(self._mute_action)
+
+        menu.addSeparator()
+
+        # Quit
+        quit_action = QtWidgets.QAction("Quit Tray Client", self)
+        quit_action.triggered.connect(self._quit)
+        menu.addAction(quit_action)
+
+        self.setContextMenu(menu)
+
+    def _systemctl(self, action: str) -> None:
+        """Run systemctl detached so a slow unit start never stalls the GUI thread."""
+        _LOGGER.info("Running: systemctl --user %s %s", action, self._systemd_service_name)
+        started = QtCore.QProcess.startDetached(
+            "systemctl", ["--user", action, self._systemd_service_name]
+        )
+        if not started:
+            _LOGGER.error("Failed to launch systemctl --user %s", action)
+
+    def _start_lva(self) -> None:
+        self._systemctl("start")
+
+    def _stop_lva(self) -> None:
+        self._systemctl("stop")
+
+    def _restart_lva(self) -> None:
+        self._systemctl("restart")
+
+    def _toggle_mute(self, checked: bool) -> None:
+        # The checkable action has already flipped itself; just record it
+        self._last_muted = checked
+        self._muted = checked
+
+        payload = "ON" if checked else "OFF"
+
+        _LOGGER.debug("Publishing mute command: %s -> %s", self._topic_mute_set, payload)
+        try:
+            self._client.publish(self._topic_mute_set, payload, retain=False)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to publish mute command")
+
+        self._update_tray_icon()
+
+    def _quit(self) -> None:
+        try:
+            self._client.loop_stop()
+            self._client.disconnect()
+        except Exception:  # noqa: BLE001
+            pass
+        self._app.quit()
+
+    # ------------------------------------------------------------------
+    # MQTT callbacks
+    # ------------------------------------------------------------------
+
+    def _on_connect(self, client, userdata, flags, rc):  # noqa: ARG002
+        if rc == 0:
+            self._connected = True
+            _LOGGER.info("Connected to MQTT broker (tray)")
+            self._suppress_updates = True
+            QtCore.QMetaObject.invokeMethod(
+                self._settle_timer, "start", QtCore.Qt.QueuedConnection
+            )
+            topics = [
+                self._topic_availability,
+                self._topic_mute_state,
+                *self._light_topic_to_state,
+            ]
+            client.subscribe([(topic, 1) for topic in topics])
+        else:
+            _LOGGER.error("Failed to connect to MQTT, return code %d", rc)
+
+    def _on_disconnect(self, client, userdata, rc):  # noqa: ARG002
+        _LOGGER.warning("MQTT disconnected (rc=%s)", rc)
+        self._connected = False
+        self._schedule_update()
+
+    def _on_message(self, client, userdata, msg):  # noqa: ARG002
+        _LOGGER.debug("Unhandled MQTT message: topic=%s", msg.topic)
+
+    def _on_availability(self, client, userdata, msg):  # noqa: ARG002
+        _LOGGER.debug("MQTT availability: %s", msg.payload)
+        try:
+            self._handle_availability(msg.payload)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error handling availability")
+
+    def _on_mute_state(self, client, userdata, msg):  # noqa: ARG002
+        _LOGGER.debug("MQTT mute state: %s", msg.payload)
+        try:
+            self._handle_mute_state(msg.payload)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error handling mute state")
+
+    def _on_light_state(self, state_name, client, userdata, msg):  # noqa: ARG002
+        payload = msg.payload
+        if payload == self._last_light_payload.get(msg.topic):
+            return
+        self._last_light_payload[msg.topic] = payload
+        _LOGGER.debug("MQTT %s light state: %s", state_name, payload)
+        self._light_updates.put((state_name, payload))
+        self._schedule_update()
+
+    # ------------------------------------------------------------------
+    # MQTT handlers
+    # ------------------------------------------------------------------
+
+    def _handle_availability(self, payload: bytes) -> None:
+        self._available = payload.strip().lower() == b"online"
+        self._schedule_update()
+
+    def _handle_mute_state(self, payload: bytes) -> None:
+        self._muted = payload.strip().upper() == b"ON"
+        self._schedule_update()
+
+    def _handle_light_state(self, state_name: str, payload: bytes) -> None:
+        """
+        Handle JSON from .../<state_name>_light/state
+        Example payload:
+          {"state": "ON", "brightness": 127,
+           "color": {"r": 0, "g": 0, "b": 255}}
+        """
+        match = _FAST_LIGHT_RE.search(payload)
+        if match is not None:
+            state_flag = match.group(1).decode()
+            brightness, r, g, b = map(int, match.group(2, 3, 4, 5))
+        else:
+            try:
+                data = _json_loads(payload)
+            except ValueError:
+                _LOGGER.warning("Invalid JSON on light state: %s", payload)
+                return
+
+            state_flag = str(data.get("state", "OFF")).upper()
+            color_dict = data.get("color", {}) or {}
+            brightness = int(data.get("brightness", 255))
+
+            r = int(color_dict.get("r", 0))
+            g = int(color_dict.get("g", 0))
+            b = int(color_dict.get("b", 0))
+
+        brightness = max(0, min(brightness, 255))
+
+        # Apply brightness scaling
+        rgb = _SCALE_LUT[brightness, np.clip((r, g, b), 0, 255)]
+        colors = self._colors_arr[self._state_idx[state_name]]
+        colors[0] = rgb
+        colors[1] = _muted_tint(rgb)
+
+        # State transitions:
+        # - For non-idle: treat "ON" as "this is the active state"
+        # - For idle: always treat updates as the baseline idle state
+        if state_name == SatelliteState.IDLE.value:
+            self._current_state = SatelliteState.IDLE.value
+        else:
+            if state_flag == "ON":
+                self._current_state = state_name
+
+    # ------------------------------------------------------------------
+    # Icon rendering
+    # ------------------------------------------------------------------
+
+    def _display_color(self, key: str, muted: bool) -> RGB:
+        """Return the cached icon color for ``key``; no per-call arithmetic."""
+        idx = self._state_idx.get(key)
+        if idx is None:
+            return _OFFLINE_RGB
+        return tuple(self._colors_arr[idx, int(muted)].tolist())
+
+    def _set_icon_by_key(self, key: str, rgb: RGB, muted: bool) -> None:
+        if rgb != self._last_icon_rgb:
+            self._last_icon_rgb = rgb
+            self.setIcon(_circle_icon(rgb))
+
+        tooltip_state = f"{key} (muted)" if muted else key
+        tip = f"{self._device_name} – {tooltip_state}"
+        if tip != self._last_tip:
+            self._last_tip = tip
+            self.setToolTip(tip)
+            self._status_action.setText(tip)
+
+    def _schedule_update(self) -> None:
+        """Request a redraw; safe to call from the MQTT thread."""
+        if self._update_pending or self._suppress_updates:
+            return
+        self._update_pending = True
+        QtCore.QMetaObject.invokeMethod(
+            self._update_timer, "start", QtCore.Qt.QueuedConnection
+        )
+
+    def _release_updates(self) -> None:
+        self._suppress_updates = False
+        self._flush_update()
+
+    def _flush_update(self) -> None:
+        self._update_pending = False
+        while True:
+            try:
+                state_name, payload = self._light_updates.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._handle_light_state(state_name, payload)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error handling %s light state", state_name)
+        self._update_tray_icon()
+
+    def _update_tray_icon(self) -> None:
+        available = self._connected and self._available
+        key = self._current_state if available else "offline"
+        muted = self._muted and available
+        rgb = self._display_color(key, muted)
+
+        # Every setIcon/setToolTip is a round-trip to the status notifier host;
+        # nothing to do unless the visible result changed.
+        display_key = (available, key, rgb, self._muted)
+        if display_key == self._last_display_key:
+            return
+        self._last_display_key = display_key
+
+        if self._muted != self._last_muted:
+            self._last_muted = self._muted
+            self._mute_action.setChecked(self._muted)
+        self._set_icon_by_key(key, rgb, muted)
@@ -1,6 +1,7 @@
 """Utility methods."""
 
 import logging
+import os
 import uuid
 from collections.abc import Callable
 from typing import Optional
@@ -8,19 +9,69 @@ from typing import Optional
 _LOGGER = logging.getLogger(__name__)
 _CACHED_MAC: Optional[str] = None
 
+_SYSFS_NET = "/sys/class/net"
+
+# Interface name prefixes tried in order: wired first, then wireless
+_MAC_INTERFACE_PREFIXES = ("eth", "en", "wlan", "wl")
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _read_sysfs_mac() -> Optional[str]:
+    """Read the first usable MAC from sysfs, preferring wired interfaces."""
+    try:
+        names = sorted(os.listdir(_SYSFS_NET))
+    except OSError:
+        return None
+
+    for prefix in _MAC_INTERFACE_PREFIXES:
+        for name in names:
+            if not name.startswith(prefix):
+                continue
+            try:
+                with open(f"{_SYSFS_NET}/{name}/address", "rb") as f:
+                    raw = f.read(17)
+            except OSError:
+                continue
+            mac_hex = raw.strip().replace(b":", b"").decode("ascii").lower()
+            if len(mac_hex) == 12 and mac_hex != "000000000000":
+                _LOGGER.debug("Using MAC address of %s from sysfs: %s", name, mac_hex)
+                return mac_hex
+
+    return None
+
 
 def get_mac_address() -> str:
     """
     Get the MAC address as a hex string (lowercase, no colons).
     Example: "b827eb123456"
 
-    This is a thin wrapper around uuid.getnode(), cached so we only
-    compute/log it once per process.
+    An externally provisioned LVA_MAC environment variable (any of the
+    usual separators allowed) takes priority. Otherwise reads
+    /sys/class/net directly (wired, then wireless interfaces) and falls
+    back to uuid.getnode(), which may shell out to ip/ifconfig.
+    Cached so we only compute/log it once per process.
     """
     global _CACHED_MAC
     if _CACHED_MAC:
         return _CACHED_MAC
 
+    env_mac = os.environ.get("LVA_MAC")
+    if env_mac:
+        env_hex = (
+            env_mac.strip().replace(":", "").replace("-", "").replace(".", "").lower()
+        )
+        if len(env_hex) == 12 and set(env_hex) <= _HEX_DIGITS:
+            _LOGGER.debug("Using MAC address from LVA_MAC: %s", env_hex)
+            _CACHED_MAC = env_hex
+            return _CACHED_MAC
+        _LOGGER.warning("Ignoring invalid LVA_MAC value: %r", env_mac)
+
+    mac_hex = _read_sysfs_mac()
+    if mac_hex:
+        _CACHED_MAC = mac_hex
+        return _CACHED_MAC
+
     node = uuid.getnode()
     mac_hex = f"{node:012x}"
 
@@ -41,7 +92,13 @@ def format_mac(mac: str) -> str:
     # Remove existing colons and other separators
     clean_mac = mac.replace(":", "").replace("-", "").replace(".", "")
 
-    # Format with colons every 2 characters
+    # Format with colons every 2 characters. bytes.hex() does it in one C call
+    # but always emits lowercase, so only use it when that preserves the input.
+    if len(clean_mac) >= 12 and clean_mac == clean_mac.lower():
+        try:
+            return bytes.fromhex(clean_mac[:12]).hex(":")
+        except ValueError:
+            pass  # not valid hex; best-effort slicing below
     return ":".join(clean_mac[i : i + 2] for i in range(0, 12, 2))
 
 
@@ -55,6 +112,16 @@ def call_all(*callables: Optional[Callable[[], None]]) -> None:
         item()
 
 
+def call_all2(
+    first: Optional[Callable[[], None]], second: Optional[Callable[[], None]]
+) -> None:
+    """Two-argument call_all without the varargs tuple and filter iterator."""
+    if first:
+        first()
+    if second:
+        second()
+
+
 def is_arm() -> bool:
     """Detect if running on ARM architecture (e.g., Raspberry Pi)."""
     try:
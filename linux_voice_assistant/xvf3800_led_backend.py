@@ -14,11 +14,15 @@ used by LVA without shelling out to xvf_host.py.
 
 from __future__ import annotations
 
+import array
 import logging
 import struct
+import threading
 import time
-from typing import List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 import usb.core  # type: ignore[import]
 import usb.util  # type: ignore[import]
 
@@ -27,6 +31,13 @@ _LOGGER = logging.getLogger(__name__)
 CONTROL_SUCCESS = 0
 SERVICER_COMMAND_RETRY = 64
 
+_CTRL_IN_VENDOR_DEVICE = (
+    usb.util.CTRL_IN | usb.util.CTRL_TYPE_VENDOR | usb.util.CTRL_RECIPIENT_DEVICE
+)
+_CTRL_OUT_VENDOR_DEVICE = (
+    usb.util.CTRL_OUT | usb.util.CTRL_TYPE_VENDOR | usb.util.CTRL_RECIPIENT_DEVICE
+)
+
 # name -> (resid, cmdid, count, access, type)
 PARAMETERS = {
     # ---------------------------------------------------------------------
@@ -60,6 +71,61 @@ PARAMETERS = {
     "GPO_WRITE_VALUE": (20, 1, 2, "wo", "uint8"),   # [pin_index, value]
 }
 
+# struct format codes for each parameter type
+_STRUCT_CODES = {"uint8": "B", "uint32": "I", "int32": "i"}
+
+# Wire size of one value of each parameter type
+_VALUE_SIZES = {"uint8": 1, "uint32": 4, "int32": 4}
+
+
+class _ParamSpec(NamedTuple):
+    """A PARAMETERS entry with its per-transfer values resolved up front."""
+
+    resid: int
+    cmdid: int
+    value_count: int
+    data_type: str
+    readable: bool
+    writable: bool
+    read_wvalue: int  # per XMOS protocol: read is (0x80 | cmdid)
+    payload_size: int
+    read_length: int  # payload + leading status byte
+
+
+_PARAM_SPECS: Dict[str, _ParamSpec] = {
+    name: _ParamSpec(
+        resid=resid,
+        cmdid=cmdid,
+        value_count=count,
+        data_type=data_type,
+        readable=access != "wo",
+        writable=access != "ro",
+        read_wvalue=0x80 | cmdid,
+        payload_size=count * _VALUE_SIZES[data_type],
+        read_length=count * _VALUE_SIZES[data_type] + 1,
+    )
+    for name, (resid, cmdid, count, access, data_type) in PARAMETERS.items()
+}
+
+
+def _param_spec(name: str) -> _ParamSpec:
+    try:
+        return _PARAM_SPECS[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown XVF3800 parameter '{name}'") from exc
+
+
+@lru_cache(maxsize=None)
+def _struct_for(data_type: str, count: int) -> struct.Struct:
+    """Little-endian Struct for `count` values, compiled once per shape."""
+    return struct.Struct("<" + _STRUCT_CODES[data_type] * count)
+
+
+@lru_cache(maxsize=256)
+def _solid_ring_payload(color_value: int, count: int) -> bytes:
+    """LED_RING_COLOR payload with every LED set to one 0xRRGGBB value."""
+    return struct.pack("<I", color_value) * count
+
 
 class _ReSpeaker:
     """Low-level USB control wrapper for XVF3800 parameters."""
@@ -70,6 +136,12 @@ class _ReSpeaker:
 
     def __init__(self, dev: "usb.core.Device") -> None:  # type: ignore[name-defined]
         self.dev = dev
+        # Bound once; every LED frame goes through it
+        self._ctrl_transfer = dev.ctrl_transfer
+        # Reused OUT payload buffers keyed by size. PyUSB sends an array('B')
+        # as-is, so filling these in place avoids a fresh bytes object plus
+        # PyUSB's own copy on every write.
+        self._tx_bufs: Dict[int, Tuple[array.array, memoryview]] = {}
 
     # CRITICAL FIX: Add context manager support
     def __enter__(self):
@@ -90,35 +162,37 @@ class _ReSpeaker:
                 _LOGGER.debug("Error disposing USB resources: %s", e)
             finally:
                 self.dev = None
+                self._ctrl_transfer = None
 
     # ------------------------------------------------------------------
     # Encoding / decoding helpers
     # ------------------------------------------------------------------
 
-    def _pack_values(self, data_type: str, values: Sequence[int]) -> bytes:
-        if data_type == "uint8":
-            return bytes([int(v) & 0xFF for v in values])
-        if data_type == "uint32":
-            return b"".join(struct.pack("<I", int(v) & 0xFFFFFFFF) for v in values)
-        if data_type == "int32":
-            return b"".join(struct.pack("<i", int(v)) for v in values)
-        raise ValueError(f"Unsupported data type '{data_type}'")
+    def _pack_into(self, data_type: str, values: Sequence[int], buf) -> None:
+        # Callers already normalise to in-range ints (set_effect masks,
+        # set_brightness clamps, ...), so values go to struct untouched.
+        if data_type not in _STRUCT_CODES:
+            raise ValueError(f"Unsupported data type '{data_type}'")
+        if data_type == "uint8" and isinstance(values, (bytes, bytearray, memoryview)):
+            memoryview(buf)[: len(values)] = values
+            return
+        try:
+            _struct_for(data_type, len(values)).pack_into(buf, 0, *values)
+        except struct.error as exc:
+            raise ValueError(f"Cannot pack {list(values)} as {data_type}: {exc}") from exc
+
+    def _tx_buffer(self, size: int) -> Tuple[array.array, memoryview]:
+        entry = self._tx_bufs.get(size)
+        if entry is None:
+            buf = array.array("B", bytes(size))
+            entry = self._tx_bufs[size] = (buf, memoryview(buf))
+        return entry
 
     def _unpack_values(self, data_type: str, raw: bytes, count: int) -> List[int]:
         if data_type == "uint8":
             return list(raw[:count])
-        if data_type == "uint32":
-            return list(struct.unpack("<" + "I" * count, raw[: count * 4]))
-        if data_type == "int32":
-            return list(struct.unpack("<" + "i" * count, raw[: count * 4]))
-        raise ValueError(f"Unsupported data type '{data_type}'")
-
-    def _read_length(self, data_type: str, count: int) -> int:
-        # +1 for status byte returned by XMOS vendor control read
-        if data_type == "uint8":
-            return count + 1
-        if data_type in ("uint32", "int32"):
-            return (count * 4) + 1
+        if data_type in _STRUCT_CODES:
+            return list(_struct_for(data_type, count).unpack_from(raw))
         raise ValueError(f"Unsupported data type '{data_type}'")
 
     # ------------------------------------------------------------------
@@ -126,19 +200,35 @@ class _ReSpeaker:
     # ------------------------------------------------------------------
 
     def write(self, name: str, data_list: Sequence[int]) -> None:
-        try:
-            resid, cmdid, count, access, data_type = PARAMETERS[name]
-        except KeyError as exc:
-            raise ValueError(f"Unknown XVF3800 parameter '{name}'") from exc
+        spec = _param_spec(name)
+        if not spec.writable:
+            raise ValueError(f"{name} is read-only")
+
+        if len(data_list) != spec.value_count:
+            raise ValueError(f"{name} expects {spec.value_count} values, got {len(data_list)}")
 
-        if access == "ro":
+        buf, _ = self._tx_buffer(spec.payload_size)
+        self._pack_into(spec.data_type, data_list, buf)
+        self._write_payload(name, spec.resid, spec.cmdid, buf)
+
+    def write_raw(self, name: str, payload: bytes) -> None:
+        """Write a parameter from an already little-endian packed payload."""
+        spec = _param_spec(name)
+        if not spec.writable:
             raise ValueError(f"{name} is read-only")
 
-        if len(data_list) != count:
-            raise ValueError(f"{name} expects {count} values, got {len(data_list)}")
+        if len(payload) != spec.payload_size:
+            raise ValueError(
+                f"{name} expects {spec.payload_size} bytes, got {len(payload)}"
+            )
 
-        payload = self._pack_values(data_type, data_list)
+        buf, view = self._tx_buffer(spec.payload_size)
+        view[:] = payload
+        self._write_payload(name, spec.resid, spec.cmdid, buf)
 
+    def _write_payload(
+        self, name: str, resid: int, cmdid: int, payload: array.array
+    ) -> None:
         _LOGGER.debug(
             "XVF3800 write: name=%s resid=%s cmdid=%s payload_len=%d",
             name,
@@ -147,10 +237,8 @@ class _ReSpeaker:
             len(payload),
         )
 
-        self.dev.ctrl_transfer(
-            usb.util.CTRL_OUT
-            | usb.util.CTRL_TYPE_VENDOR
-            | usb.util.CTRL_RECIPIENT_DEVICE,
+        self._ctrl_transfer(
+            _CTRL_OUT_VENDOR_DEVICE,
             0,
             cmdid,
             resid,
@@ -159,28 +247,19 @@ class _ReSpeaker:
         )
 
     def read(self, name: str, max_retries: int = 10) -> List[int]:
-        try:
-            resid, cmdid, count, access, data_type = PARAMETERS[name]
-        except KeyError as exc:
-            raise ValueError(f"Unknown XVF3800 parameter '{name}'") from exc
-
-        if access == "wo":
+        spec = _param_spec(name)
+        if not spec.readable:
             raise ValueError(f"{name} is write-only")
 
-        length = self._read_length(data_type, count)
-        wValue = 0x80 | cmdid  # per XMOS protocol: read is (0x80 | cmdid)
-
         attempt = 0
         while True:
             attempt += 1
-            resp = self.dev.ctrl_transfer(
-                usb.util.CTRL_IN
-                | usb.util.CTRL_TYPE_VENDOR
-                | usb.util.CTRL_RECIPIENT_DEVICE,
+            resp = self._ctrl_transfer(
+                _CTRL_IN_VENDOR_DEVICE,
                 0,
-                wValue,
-                resid,
-                length,
+                spec.read_wvalue,
+                spec.resid,
+                spec.read_length,
                 self.TIMEOUT_MS,
             )
 
@@ -190,7 +269,7 @@ class _ReSpeaker:
             status = int(resp[0])
             if status == CONTROL_SUCCESS:
                 raw = bytes(resp[1:])
-                return self._unpack_values(data_type, raw, count)
+                return self._unpack_values(spec.data_type, raw, spec.value_count)
 
             if status == SERVICER_COMMAND_RETRY and attempt < max_retries:
                 continue
@@ -281,7 +360,16 @@ class XVF3800LedBackend:
     # GPO indices (from XVF3800 documentation)
     GPO_WS2812_POWER_INDEX = 3  # X0D33 in GPO_READ_VALUES response
 
-    def __init__(self, vid: int = _ReSpeaker.VID, pid: int = _ReSpeaker.PID) -> None:
+    # Re-read the WS2812 power pin at most this often; otherwise every
+    # animation frame would pay a GPO_READ_VALUES round-trip first.
+    LED_POWER_CHECK_INTERVAL_S = 2.0
+
+    def __init__(
+        self,
+        vid: int = _ReSpeaker.VID,
+        pid: int = _ReSpeaker.PID,
+        coalesce_frames: bool = False,
+    ) -> None:
         wrapper = _find_device(vid, pid)
         if wrapper is None:
             raise RuntimeError(
@@ -290,6 +378,21 @@ class XVF3800LedBackend:
 
         self._dev = wrapper
         self.supports_per_led: bool = False
+        self._power_verified_at: Optional[float] = None
+
+        # Optional frame writer: ring frames are handed to a worker thread that
+        # only ever sends the newest one, so animation callers never block on
+        # the USB round-trip and stale frames are dropped instead of queued.
+        self._coalesce_frames = coalesce_frames
+        self._frame_cv = threading.Condition()
+        self._pending_frame: Optional[bytes] = None
+        self._frame_busy = False
+        self._frame_stop = False
+        self._frame_thread: Optional[threading.Thread] = None
+
+        # Last values written per parameter; identical requests skip USB
+        self._last_ring_payload: Optional[bytes] = None
+        self._last_written: Dict[str, int] = {}
         
         # CRITICAL FIX: Ensure WS2812 LED power is enabled BEFORE any LED operations
         # This prevents intermittent LED failures caused by X0D33 being low at startup
@@ -333,15 +436,27 @@ class XVF3800LedBackend:
     # Helper: Ensure LED power before critical operations
     # ---------------------------------------------------------------------
     
-    def _ensure_led_power(self) -> bool:
+    def _ensure_led_power(self, force: bool = False) -> bool:
         """Ensure WS2812 LED power is enabled before operations.
         
         This provides belt-and-suspenders protection against the LED power
-        being disabled by firmware or button interactions.
+        being disabled by firmware or button interactions. A successful
+        check is trusted for LED_POWER_CHECK_INTERVAL_S unless force is set
+        (e.g. after a reboot or button event).
         
         Returns:
             bool: True if power is confirmed on, False if check failed
         """
+        now = time.monotonic()
+        verified_at = self._power_verified_at
+        if (
+            not force
+            and verified_at is not None
+            and now - verified_at < self.LED_POWER_CHECK_INTERVAL_S
+        ):
+            return True
+
+        self._power_verified_at = None
         try:
             # Read GPO values
             values = self._dev.read("GPO_READ_VALUES")
@@ -349,9 +464,11 @@ class XVF3800LedBackend:
                 ws2812_power = bool(values[self.GPO_WS2812_POWER_INDEX])
                 if not ws2812_power:
                     _LOGGER.warning("WS2812 LED power was off, re-enabling")
+                    # The ring lost its state, so the next frame must be sent
+                    self._last_ring_payload = None
                     self._dev.write("GPO_WRITE_VALUE", [33, 1])
                     time.sleep(0.01)  # Brief settle time
-                    return True
+                self._power_verified_at = now
                 return True
         except Exception as e:
             _LOGGER.debug("Could not verify WS2812 LED power state: %s", e)
@@ -363,19 +480,32 @@ class XVF3800LedBackend:
     # ---------------------------------------------------------------------
 
     def set_effect(self, effect_id: int) -> None:
-        """Set LED effect mode (0=off, 1=breath, 2=rainbow, 3=single color, 4=doa)."""
+        """Set LED effect mode (0=off, 1=breath, 2=rainbow, 3=single color, 4=doa).
+
+        Always sent: the firmware re-enables its own effects (e.g. DOA) behind
+        our back, so a remembered value cannot be trusted.
+        """
+        value = int(effect_id) & 0xFF
+        self.flush()
         # Ensure power before effect change
         self._ensure_led_power()
-        self._dev.write("LED_EFFECT", [int(effect_id) & 0xFF])
+        self._dev.write("LED_EFFECT", [value])
 
     def set_brightness(self, brightness_0_255: int) -> None:
         """Set LED brightness (0-255)."""
         value = max(0, min(255, int(brightness_0_255)))
-        self._dev.write("LED_BRIGHTNESS", [value])
+        if self._last_written.get("LED_BRIGHTNESS") == value:
+            return
+        self.flush()
+        self._write_cached("LED_BRIGHTNESS", value)
 
     def set_speed(self, speed_id: int) -> None:
         """Set LED effect speed (0=slow, 1=medium, 2=fast)."""
-        self._dev.write("LED_SPEED", [int(speed_id) & 0xFF])
+        value = int(speed_id) & 0xFF
+        if self._last_written.get("LED_SPEED") == value:
+            return
+        self.flush()
+        self._write_cached("LED_SPEED", value)
 
     def set_color(self, r: int, g: int, b: int) -> None:
         """Set LED color for breath / single color modes (0xRRGGBB)."""
@@ -383,7 +513,28 @@ class XVF3800LedBackend:
         g = max(0, min(255, int(g)))
         b = max(0, min(255, int(b)))
         color_value = (r << 16) | (g << 8) | b
-        self._dev.write("LED_COLOR", [color_value])
+        if self._last_written.get("LED_COLOR") == color_value:
+            return
+        self.flush()
+        self._write_cached("LED_COLOR", color_value)
+
+    def _write_cached(self, name: str, value: int) -> None:
+        """Write a single-value parameter and remember it once it succeeded."""
+        self._last_written.pop(name, None)
+        self._dev.write(name, [value])
+        self._last_written[name] = value
+
+    def invalidate_cache(self) -> None:
+        """Forget last-written values so the next request is always sent.
+
+        Call this when the device state may have changed behind our back
+        (reboot, mute button / X0D33 power toggles, external xvf_host use).
+        """
+        with self._frame_cv:
+            self._last_ring_payload = None
+        self._last_written.clear()
+        # A button press may have cut X0D33; re-check power on the next write
+        self._power_verified_at = None
 
     # ---------------------------------------------------------------------
     # Per-LED ring control (newer firmware)
@@ -398,9 +549,11 @@ class XVF3800LedBackend:
                 f"LED_RING_COLOR expects {self.ring_led_count} values, got {len(color_values)}"
             )
         
-        # Ensure power before writing ring colors
-        self._ensure_led_power()
-        self._dev.write("LED_RING_COLOR", [int(v) & 0xFFFFFFFF for v in color_values])
+        self._submit_ring_frame(
+            _struct_for("uint32", self.ring_led_count).pack(
+                *[int(v) & 0xFFFFFFFF for v in color_values]
+            )
+        )
 
     def set_ring_rgb(self, colors: Sequence[Tuple[int, int, int]]) -> None:
         """Set all 12 ring LEDs with (r,g,b) tuples (length must be 12)."""
@@ -408,17 +561,30 @@ class XVF3800LedBackend:
             raise ValueError(
                 f"Ring expects {self.ring_led_count} colors, got {len(colors)}"
             )
-        vals: List[int] = []
-        for r, g, b in colors:
-            r = max(0, min(255, int(r)))
-            g = max(0, min(255, int(g)))
-            b = max(0, min(255, int(b)))
-            vals.append((r << 16) | (g << 8) | b)
-        self.set_ring_colors(vals)
+        if not self.supports_per_led:
+            raise RuntimeError("Per-LED ring control is not supported by this firmware")
+
+        self._submit_ring_frame(self._pack_ring_bytes(colors))
+
+    @staticmethod
+    def _pack_ring_bytes(colors: Sequence[Tuple[int, int, int]]) -> bytes:
+        """Clamp (r,g,b) tuples and pack them as little-endian 0xRRGGBB uint32s."""
+        rgb = np.clip(np.asarray(colors, dtype=np.int64), 0, 255)
+        packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        return packed.astype("<u4").tobytes()
 
     def set_ring_solid(self, r: int, g: int, b: int) -> None:
         """Convenience: set all ring LEDs to the same RGB color."""
-        self.set_ring_rgb([(r, g, b)] * self.ring_led_count)
+        if not self.supports_per_led:
+            raise RuntimeError("Per-LED ring control is not supported by this firmware")
+        r = max(0, min(255, int(r)))
+        g = max(0, min(255, int(g)))
+        b = max(0, min(255, int(b)))
+
+        # Solid frames repeat (idle, mute, pulse steps): reuse packed payloads
+        self._submit_ring_frame(
+            _solid_ring_payload((r << 16) | (g << 8) | b, self.ring_led_count)
+        )
 
     def clear_ring(self) -> None:
         """Convenience: turn all ring LEDs off (per-LED mode)."""
@@ -427,7 +593,90 @@ class XVF3800LedBackend:
             self.set_effect(0)
             self.set_brightness(0)
             return
-        self.set_ring_colors([0] * self.ring_led_count)
+        self._submit_ring_frame(_solid_ring_payload(0, self.ring_led_count))
+
+    # ---------------------------------------------------------------------
+    # Ring frame delivery
+    # ---------------------------------------------------------------------
+
+    def _write_ring_frame(self, payload: bytes) -> None:
+        # Ensure power before writing ring colors
+        self._ensure_led_power()
+        self._dev.write_raw("LED_RING_COLOR", payload)
+
+    def _submit_ring_frame(self, payload: bytes) -> None:
+        """Write a packed LED_RING_COLOR frame, or hand it to the frame writer.
+
+        Frames equal to the last one submitted are skipped entirely.
+        """
+        if not self._coalesce_frames:
+            if payload == self._last_ring_payload:
+                return
+            self._last_ring_payload = payload
+            try:
+                self._write_ring_frame(payload)
+            except Exception:
+                self._last_ring_payload = None
+                raise
+            return
+
+        with self._frame_cv:
+            # Compare against the newest submitted frame, not the last one
+            # sent, so a still-pending older frame can never end up on screen.
+            if self._frame_stop or payload == self._last_ring_payload:
+                return
+            self._last_ring_payload = payload
+            # Overwrite rather than enqueue: only the newest frame matters
+            self._pending_frame = payload
+            if self._frame_thread is None:
+                self._frame_thread = threading.Thread(
+                    target=self._frame_worker,
+                    name="xvf3800-led-frames",
+                    daemon=True,
+                )
+                self._frame_thread.start()
+            self._frame_cv.notify()
+
+    def _frame_worker(self) -> None:
+        cv = self._frame_cv
+        while True:
+            with cv:
+                while self._pending_frame is None and not self._frame_stop:
+                    cv.wait()
+                payload = self._pending_frame
+                if payload is None:
+                    return
+                self._pending_frame = None
+                self._frame_busy = True
+
+            try:
+                self._write_ring_frame(payload)
+            except Exception:
+                _LOGGER.exception("Failed to write XVF3800 LED ring frame")
+                with cv:
+                    if self._last_ring_payload is payload:
+                        self._last_ring_payload = None
+            finally:
+                with cv:
+                    self._frame_busy = False
+                    cv.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until any pending ring frame has been written.
+
+        Ordered writes (effect, brightness, ...) call this first so they can
+        never be overtaken by an older frame still waiting in the writer.
+
+        Returns:
+            bool: False if the timeout expired with a frame still pending
+        """
+        if self._frame_thread is None:
+            return True
+        with self._frame_cv:
+            return self._frame_cv.wait_for(
+                lambda: self._pending_frame is None and not self._frame_busy,
+                timeout,
+            )
 
     def get_version(self) -> Optional[Tuple[int, int, int]]:
         """Return (major, minor, patch) if readable, else None."""
@@ -440,5 +689,13 @@ class XVF3800LedBackend:
         return None
 
     def close(self) -> None:
+        thread = self._frame_thread
+        if thread is not None:
+            # Let the last frame land before the device goes away
+            with self._frame_cv:
+                self._frame_stop = True
+                self._frame_cv.notify_all()
+            thread.join(timeout=1.0)
+            self._frame_thread = None
         if self._dev is not None:
             self._dev.close()
@@ -39,6 +39,15 @@ class TestButtonRuntimeConfig:
 
         assert config.poll_interval_seconds == 0.1
 
+    def test_button_runtime_config_is_frozen(self):
+        """Test ButtonRuntimeConfig cannot change under the polling thread."""
+        import dataclasses
+
+        config = ButtonRuntimeConfig(enabled=True, pin=17, long_press_seconds=1.0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.poll_interval_seconds = 0.01
+
 
 class TestButtonControllerInitialization:
     """Test ButtonController initialization and setup."""
@@ -190,6 +199,35 @@ class TestButtonControllerGPIOUnavailable:
             # If exception occurs, it should be informative
             assert "GPIO" in str(e) or "RPi" in str(e)
 
+    def test_stop_wakes_polling_thread(self, mock_state, monkeypatch):
+        """Test stop() does not wait out a long poll interval."""
+        fake_gpio = MagicMock()
+        fake_gpio.input.return_value = 1  # released
+        monkeypatch.setattr("linux_voice_assistant.button_controller.GPIO", fake_gpio)
+
+        slow_config = Mock(
+            enabled=True,
+            pin=17,
+            long_press_seconds=1.0,
+            poll_interval_seconds=5.0,
+        )
+        controller = ButtonController(
+            loop=mock_state.loop,
+            event_bus=mock_state.event_bus,
+            state=mock_state,
+            config=slow_config
+        )
+        assert controller._thread is not None
+
+        # Let the thread reach its first wait
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        controller.stop()
+
+        assert time.monotonic() - start < 1.0
+        assert not controller._thread.is_alive()
+
 
 class TestButtonControllerPressTiming:
     """Test button press timing and detection."""
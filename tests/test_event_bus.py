@@ -101,6 +101,36 @@ class TestEventBus:
         assert ("method1", {"event": "1"}) in call_log
         assert ("method2", {"event": "2"}) in call_log
 
+    def test_event_handler_inherited_subscriptions(self):
+        """Test subclasses inherit @subscribe methods unless overridden plainly."""
+        bus = EventBus()
+        call_log = []
+
+        class BaseHandler(EventHandler):
+            def __init__(self, event_bus):
+                super().__init__(event_bus)
+                self._subscribe_all_methods()
+
+            @subscribe
+            def inherited(self, data):
+                call_log.append("inherited")
+
+            @subscribe
+            def overridden(self, data):
+                call_log.append("base_overridden")
+
+        class ChildHandler(BaseHandler):
+            def overridden(self, data):
+                call_log.append("child_overridden")
+
+        assert ChildHandler._subscribed_methods == ("inherited",)
+
+        ChildHandler(bus)
+        bus.publish("inherited", {})
+        bus.publish("overridden", {})
+
+        assert call_log == ["inherited"]
+
     def test_unsubscribe(self):
         """Test that unsubscribe is not implemented (missing functionality)."""
         bus = EventBus()
@@ -331,6 +331,17 @@ class TestLedControllerStateTransitions:
         assert hasattr(minimal_controller, '_mic_is_muted')
         assert isinstance(minimal_controller._mic_is_muted, bool)
 
+    def test_state_changes_invalidate_xvf3800_cache(self, minimal_controller):
+        """Test new states and mute events drop the XVF3800 last-written cache."""
+        backend = MagicMock()
+        minimal_controller._xvf3800_backend = backend
+
+        minimal_controller.voice_listen({})
+        minimal_controller.mic_muted({})
+        minimal_controller.mic_unmuted({})
+
+        assert backend.invalidate_cache.call_count == 3
+
     def test_led_controller_ready_state(self, minimal_controller):
         """Test LED controller ready state management."""
         # Initially not ready
@@ -0,0 +1,605 @@
+"""Tests for the Sendspin playback pipeline (decoder/sink lifecycle)."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from linux_voice_assistant.sendspin.player import SendspinPlayerPipeline, _ChunkFifo
+
+
+def _make_pipeline(loop, player_cfg=None):
+    return SendspinPlayerPipeline(
+        loop=loop,
+        config={"player": player_cfg or {}},
+        client_id="test-client",
+        stop_event=asyncio.Event(),
+        disconnect_event=asyncio.Event(),
+    )
+
+
+class TestDecoderLifecycle:
+    """Test decoder task supervision."""
+
+    @pytest.mark.asyncio
+    async def test_stop_decoder_cancels_all_loops(self):
+        """Cancelling the supervisor task cancels every decoder loop."""
+        pipeline = _make_pipeline(asyncio.get_running_loop(), {"ffmpeg_debug_stderr": True})
+        cancelled = []
+
+        async def _forever(name):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        with patch.object(pipeline, "_decoder_writer_loop", lambda: _forever("writer")), \
+                patch.object(pipeline, "_decoder_reader_loop", lambda: _forever("reader")), \
+                patch.object(pipeline, "_stderr_reader_loop", lambda proc, name: _forever("stderr")):
+            pipeline._decoder_task = asyncio.get_running_loop().create_task(
+                pipeline._decoder_supervisor_loop(None)
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            task = pipeline._decoder_task
+            await pipeline._stop_decoder()
+            await asyncio.wait_for(task, timeout=1.0)
+
+        assert pipeline._decoder_task is None
+        assert task.done()
+        assert sorted(cancelled) == ["reader", "stderr", "writer"]
+
+    @pytest.mark.asyncio
+    async def test_stderr_loop_skipped_by_default(self):
+        """Decoder stderr is not drained unless ffmpeg_debug_stderr is enabled."""
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        started = []
+
+        async def _noop(name):
+            started.append(name)
+
+        with patch.object(pipeline, "_decoder_writer_loop", lambda: _noop("writer")), \
+                patch.object(pipeline, "_decoder_reader_loop", lambda: _noop("reader")), \
+                patch.object(pipeline, "_stderr_reader_loop", lambda proc, name: _noop("stderr")):
+            await pipeline._decoder_supervisor_loop(None)
+
+        assert pipeline._debug_stderr is False
+        assert sorted(started) == ["reader", "writer"]
+
+
+class TestFlacDecode:
+    """Test the in-process PyAV FLAC decode path."""
+
+    @staticmethod
+    def _encode_flac(samples):
+        av = pytest.importorskip("av")
+        import numpy as np
+
+        enc = av.CodecContext.create("flac", "w")
+        enc.sample_rate = 48000
+        enc.layout = "stereo"
+        enc.format = "s16"
+        enc.open()
+
+        stereo = np.stack([samples, samples]).T.copy()
+        frame = av.AudioFrame.from_ndarray(stereo.reshape(1, -1), format="s16", layout="stereo")
+        frame.sample_rate = 48000
+        packets = list(enc.encode(frame)) + list(enc.encode(None))
+        return [bytes(p) for p in packets]
+
+    @pytest.mark.asyncio
+    async def test_pyav_backend_decodes_to_interleaved_pcm(self):
+        """FLAC frames decode to s16le interleaved PCM without a subprocess."""
+        import numpy as np
+
+        samples = (np.sin(np.arange(4096) / 20.0) * 10000).astype(np.int16)
+        packets = self._encode_flac(samples)
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        await pipeline._select_flac_backend()
+        assert pipeline._flac_backend == "pyav"
+        assert pipeline._decoder_proc is None
+
+        pcm = b""
+        for packet in packets:
+            pcm += await pipeline._handle_flac_payload(packet) or b""
+
+        decoded = np.frombuffer(pcm, dtype="<i2").reshape(-1, 2)
+        assert decoded.shape == (4096, 2)
+        assert np.array_equal(decoded[:, 0], samples)
+        assert np.array_equal(decoded[:, 1], samples)
+
+        await pipeline._stop_decoder()
+        assert pipeline._flac_backend == "none"
+        assert pipeline._flac_ctx is None
+
+
+class TestPcmPacking:
+    """Test PCM sample packing helpers."""
+
+    def test_pack_24bit_keeps_high_bytes(self):
+        """Left-justified s32 samples pack into 3-byte little-endian samples."""
+        import numpy as np
+
+        samples = np.array([0, 1, -1, 0x7FFFFF, -0x800000], dtype=np.int32)
+        packed = SendspinPlayerPipeline._pack_24bit((samples << 8).astype("<i4").tobytes())
+
+        assert len(packed) == len(samples) * 3
+        unpacked = [int.from_bytes(packed[i:i + 3], "little", signed=True) for i in range(0, len(packed), 3)]
+        assert unpacked == samples.tolist()
+
+    def test_duration_for_24bit_stream(self, event_loop):
+        """24-bit PCM durations use 3 bytes per sample."""
+        pipeline = _make_pipeline(event_loop)
+        pipeline._stream_bit_depth = 24
+        pipeline._stream_channels = 2
+        pipeline._stream_rate = 48000
+
+        assert pipeline._pcm_bytes_to_duration_us(48000 * 2 * 3) == pytest.approx(1_000_000.0)
+
+
+class TestBinaryFrameParsing:
+    """Test Sendspin binary frame header parsing."""
+
+    def test_extract_player_frame(self, event_loop):
+        """Player frames yield type, signed big-endian timestamp and payload."""
+        pipeline = _make_pipeline(event_loop)
+        frame = bytes([4]) + (-5).to_bytes(8, "big", signed=True) + b"payload"
+
+        assert pipeline._extract_and_validate_binary_frame(frame) == (4, -5, b"payload")
+
+    def test_payload_is_zero_copy_view(self, event_loop):
+        """The payload is a view over the websocket frame, not a copy."""
+        pipeline = _make_pipeline(event_loop)
+        frame = bytes([5]) + (1).to_bytes(8, "big") + b"pcm"
+
+        _msg_type, _ts, payload = pipeline._extract_and_validate_binary_frame(frame)
+
+        assert isinstance(payload, memoryview)
+        assert payload.obj is frame
+        assert bytes(payload) == b"pcm"
+
+    def test_player_type_range(self, event_loop):
+        """Exactly message types 4-7 are accepted as player frames."""
+        pipeline = _make_pipeline(event_loop)
+
+        accepted = [
+            msg_type
+            for msg_type in range(256)
+            if pipeline._extract_and_validate_binary_frame(
+                bytes([msg_type]) + (1).to_bytes(8, "big") + b"x"
+            )[0] >= 0
+        ]
+
+        assert accepted == [4, 5, 6, 7]
+
+    def test_reject_non_player_and_short_frames(self, event_loop):
+        """Non-player message types and truncated headers are rejected."""
+        pipeline = _make_pipeline(event_loop)
+        artwork = bytes([8]) + (123).to_bytes(8, "big") + b"img"
+
+        assert pipeline._extract_and_validate_binary_frame(artwork) == (-1, 0, b"")
+        assert pipeline._extract_and_validate_binary_frame(b"\x04\x00") == (-1, 0, b"")
+        assert pipeline._invalid_msg_type_count == 1
+
+
+class TestChunkFifo:
+    """Test the bounded chunk FIFO used between pipeline stages."""
+
+    @pytest.mark.asyncio
+    async def test_fifo_order_and_bounds(self):
+        """Items come out in order and a full FIFO rejects new items."""
+        fifo = _ChunkFifo(maxsize=2)
+        fifo.put_nowait(1)
+        fifo.put_nowait(2)
+        with pytest.raises(asyncio.QueueFull):
+            fifo.put_nowait(3)
+
+        assert await fifo.get() == 1
+        assert fifo.get_nowait() == 2
+        with pytest.raises(asyncio.QueueEmpty):
+            fifo.get_nowait()
+        assert fifo.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        """A waiting consumer is woken by the next put."""
+        fifo = _ChunkFifo(maxsize=4)
+        getter = asyncio.get_running_loop().create_task(fifo.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        fifo.put_nowait(b"chunk")
+        assert await asyncio.wait_for(getter, timeout=1.0) == b"chunk"
+
+    def test_drain_keeps_queue_objects(self, event_loop):
+        """Draining empties the pipeline queues without replacing them."""
+        pipeline = _make_pipeline(event_loop)
+        pcm_queue = pipeline._pcm_queue
+        pcm_queue.put_nowait((0, 0, b"x"))
+
+        pipeline._drain_queue(pipeline._pcm_queue)
+
+        assert pipeline._pcm_queue is pcm_queue
+        assert pcm_queue.empty()
+
+
+class TestPcmCoalescing:
+    """Test coalescing of due PCM chunks before mpv writes."""
+
+    def test_coalesces_only_due_same_epoch_chunks(self, event_loop):
+        """Due chunks are merged; future or other-epoch chunks stay queued."""
+        from linux_voice_assistant.sendspin.player import _now_us
+
+        pipeline = _make_pipeline(event_loop)
+        now = _now_us()
+        pipeline._pcm_queue.put_nowait((0, now - 1000, b"bb"))
+        pipeline._pcm_queue.put_nowait((0, now - 500, b"cc"))
+        pipeline._pcm_queue.put_nowait((0, now + 10_000_000, b"dd"))
+
+        assert pipeline._coalesce_due_pcm(0, b"aa") == b"aabbcc"
+        assert pipeline._pcm_queue.qsize() == 1
+
+        pipeline._pcm_queue.get_nowait()
+        pipeline._pcm_queue.put_nowait((1, now - 1000, b"ee"))
+        assert pipeline._coalesce_due_pcm(0, b"aa") == b"aa"
+        assert pipeline._pcm_queue.qsize() == 1
+
+    def test_coalescing_drops_late_chunks(self, event_loop):
+        """Chunks beyond the late-drop threshold are discarded, not written."""
+        from linux_voice_assistant.sendspin.player import _now_us
+
+        pipeline = _make_pipeline(event_loop)
+        now = _now_us()
+        pipeline._pcm_queue.put_nowait((0, now - 10_000_000, b"late"))
+        pipeline._pcm_queue.put_nowait((0, now - 1000, b"ok"))
+
+        assert pipeline._coalesce_due_pcm(0, b"aa") == b"aaok"
+        assert pipeline._pcm_queue.empty()
+
+
+class TestMpvIpc:
+    """Test the persistent mpv IPC connection."""
+
+    @pytest.mark.asyncio
+    async def test_audio_state_reuses_one_connection(self, temp_dir):
+        """Repeated audio-state updates share one socket and pre-encoded JSON."""
+        import json
+
+        received = []
+        connections = []
+
+        async def _handle(reader, writer):
+            connections.append(writer)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                received.append(json.loads(line))
+                writer.write(b'{"error": "success"}\n')
+
+        path = str(temp_dir / "mpv.sock")
+        server = await asyncio.start_unix_server(_handle, path=path)
+        try:
+            pipeline = _make_pipeline(asyncio.get_running_loop())
+            pipeline._mpv_ipc_path = path
+            pipeline._mpv_ipc_ready = True
+            pipeline._stream_active = True
+
+            pipeline.set_audio_state(muted=True, effective_volume=40)
+            await pipeline._apply_mpv_audio_state()
+            pipeline.set_audio_state(muted=False, effective_volume=75)
+            await pipeline._apply_mpv_audio_state()
+
+            for _ in range(50):
+                if len(received) >= 4:
+                    break
+                await asyncio.sleep(0.01)
+
+            await pipeline._close_mpv_ipc()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert len(connections) == 1
+        assert received == [
+            {"command": ["set_property", "mute", True]},
+            {"command": ["set_property", "volume", 40]},
+            {"command": ["set_property", "mute", False]},
+            {"command": ["set_property", "volume", 75]},
+        ]
+        assert pipeline._mpv_ipc_writer is None
+
+    @pytest.mark.asyncio
+    async def test_updates_within_debounce_window_are_merged(self):
+        """A burst of updates is applied by the one applier task as a single send."""
+        from unittest.mock import AsyncMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._mpv_ipc_path = "/nonexistent.sock"
+        pipeline._mpv_ipc_ready = True
+        pipeline._stream_active = True
+        applier = asyncio.get_running_loop().create_task(pipeline._audio_applier_loop())
+
+        with patch.object(pipeline, "_mpv_ipc_send", AsyncMock()) as send:
+            for vol in (10, 20, 30):
+                pipeline.set_audio_state(muted=True, effective_volume=vol)
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.1)
+
+            send.assert_awaited_once()
+            assert send.await_args.args[0].endswith(b'"volume", 30]}\n')
+
+            pipeline.set_audio_state(muted=False, effective_volume=50)
+            await asyncio.sleep(0.1)
+            assert send.await_count == 2
+
+        applier.cancel()
+        await asyncio.wait({applier})
+
+    @pytest.mark.asyncio
+    async def test_wait_for_ipc_connects_once_socket_appears(self, temp_dir):
+        """IPC readiness is detected by connecting, and the connection is kept."""
+        path = str(temp_dir / "late.sock")
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._mpv_ipc_path = path
+
+        async def _handle(reader, writer):
+            await reader.read()
+
+        async def _start_later():
+            await asyncio.sleep(0.03)
+            return await asyncio.start_unix_server(_handle, path=path)
+
+        server_task = asyncio.get_running_loop().create_task(_start_later())
+        try:
+            assert await pipeline._wait_for_mpv_ipc(timeout_s=1.0) is True
+            assert pipeline._mpv_ipc_writer is not None
+            await pipeline._close_mpv_ipc()
+        finally:
+            server = await server_task
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_ipc_times_out(self, temp_dir):
+        """A socket that never appears reports not ready after the timeout."""
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._mpv_ipc_path = str(temp_dir / "missing.sock")
+
+        assert await pipeline._wait_for_mpv_ipc(timeout_s=0.2) is False
+
+
+class TestPipeWrites:
+    """Test direct fd writes used by the PCM writer."""
+
+    @pytest.mark.asyncio
+    async def test_write_fd_handles_full_pipe(self):
+        """Writes larger than the pipe buffer complete once the reader drains."""
+        import os
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        data = bytes(range(256)) * 2048  # 512 KiB, larger than a pipe buffer
+
+        received = bytearray()
+
+        def _drain():
+            received.extend(os.read(read_fd, 65536))
+
+        loop = asyncio.get_running_loop()
+        loop.add_reader(read_fd, _drain)
+        try:
+            await asyncio.wait_for(pipeline._write_fd(write_fd, data), timeout=5.0)
+            while len(received) < len(data):
+                await asyncio.sleep(0.01)
+        finally:
+            loop.remove_reader(read_fd)
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert bytes(received) == data
+
+    @pytest.mark.asyncio
+    async def test_read_fd_waits_for_data_and_eof(self):
+        """Reads wait for data on an empty pipe and return b'' at EOF."""
+        import os
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        try:
+            reader = asyncio.get_running_loop().create_task(pipeline._read_fd(read_fd, 1024))
+            await asyncio.sleep(0)
+            assert not reader.done()
+
+            os.write(write_fd, b"decoded")
+            assert await asyncio.wait_for(reader, timeout=1.0) == b"decoded"
+
+            os.close(write_fd)
+            write_fd = None
+            assert await asyncio.wait_for(pipeline._read_fd(read_fd, 1024), timeout=1.0) == b""
+        finally:
+            os.close(read_fd)
+            if write_fd is not None:
+                os.close(write_fd)
+
+
+class TestSpareMpv:
+    """Test the warm spare mpv sink."""
+
+    @staticmethod
+    def _fake_proc():
+        from unittest.mock import AsyncMock, MagicMock
+
+        proc = MagicMock()
+        proc.returncode = None
+        proc.wait = AsyncMock(return_value=0)
+        return proc
+
+    @pytest.mark.asyncio
+    async def test_matching_spare_is_adopted(self):
+        """A spare with the same raw format is handed over with its IPC path."""
+        from unittest.mock import AsyncMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        proc = self._fake_proc()
+        pipeline._mpv_ipc_path = pipeline._mpv_ipc_slot_path(0)
+
+        with patch.object(pipeline, "_exec_pcm_sink_mpv", AsyncMock(return_value=proc)) as exec_mock:
+            await pipeline._prespawn_spare_mpv((48000, 2, 16))
+
+        exec_mock.assert_awaited_once_with((48000, 2, 16), pipeline._mpv_ipc_slot_path(1))
+        assert await pipeline._take_spare_mpv((48000, 2, 16)) == (proc, pipeline._mpv_ipc_slot_path(1))
+        assert pipeline._spare_pcm_proc is None
+
+    @pytest.mark.asyncio
+    async def test_mismatched_spare_is_discarded(self):
+        """A spare for a different format is terminated instead of reused."""
+        from unittest.mock import AsyncMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        proc = self._fake_proc()
+
+        with patch.object(pipeline, "_exec_pcm_sink_mpv", AsyncMock(return_value=proc)):
+            pipeline._spare_task = asyncio.get_running_loop().create_task(
+                pipeline._prespawn_spare_mpv((48000, 2, 16))
+            )
+            assert await pipeline._take_spare_mpv((44100, 2, 16)) is None
+
+        proc.terminate.assert_called_once()
+        assert pipeline._spare_pcm_proc is None
+        assert pipeline._spare_task is None
+
+
+class TestOpusDecode:
+    """Test the opuslib fast path."""
+
+    @pytest.mark.asyncio
+    async def test_decode_reuses_output_buffer(self):
+        """libopus writes into one preallocated buffer; only valid samples are returned."""
+        import ctypes
+        from unittest.mock import MagicMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._stream_channels = 2
+        pipeline._opus_backend = "opuslib"
+        pipeline._opus_decoder = MagicMock()
+        pipeline._opus_max_frame_size = 8
+        pipeline._opus_pcm_buf = (ctypes.c_int16 * 16)()
+        buffers = []
+
+        def _fake_decode(state, data, length, pcm, frame_size, fec):
+            buffers.append(ctypes.addressof(pcm))
+            for i in range(4 * 2):
+                pcm[i] = i + 1
+            return 4
+
+        pipeline._opus_decode_fn = _fake_decode
+
+        first = await pipeline._handle_opus_payload(b"\x01\x02")
+        second = await pipeline._handle_opus_payload(b"\x03")
+
+        assert first == second == b"".join(i.to_bytes(2, "little") for i in range(1, 9))
+        assert len(set(buffers)) == 1
+
+    @pytest.mark.asyncio
+    async def test_decode_error_returns_none(self):
+        """A negative libopus return code drops the packet."""
+        import ctypes
+        from unittest.mock import MagicMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._opus_backend = "opuslib"
+        pipeline._opus_decoder = MagicMock()
+        pipeline._opus_pcm_buf = (ctypes.c_int16 * 16)()
+        pipeline._opus_decode_fn = lambda *args: -4
+
+        assert await pipeline._handle_opus_payload(b"\x01") is None
+
+    @pytest.mark.asyncio
+    async def test_buffer_grows_for_long_packets(self):
+        """A packet longer than the 20 ms fast path grows the buffer to 120 ms once."""
+        import ctypes
+        from unittest.mock import MagicMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._stream_rate = 48000
+        pipeline._stream_channels = 2
+        pipeline._opus_backend = "opuslib"
+        pipeline._opus_decoder = MagicMock()
+        pipeline._opus_max_frame_size = 960
+        pipeline._opus_pcm_buf = (ctypes.c_int16 * (960 * 2))()
+        frame_sizes = []
+
+        def _fake_decode(state, data, length, pcm, frame_size, fec):
+            frame_sizes.append(frame_size)
+            return -2 if frame_size < 2880 else 2880
+
+        pipeline._opus_decode_fn = _fake_decode
+
+        pcm = await pipeline._handle_opus_payload(b"\x01")
+
+        assert frame_sizes == [960, 5760]
+        assert len(pcm) == 2880 * 2 * 2
+        assert pipeline._opus_max_frame_size == 5760
+
+
+class TestCodecRouting:
+    """Test binary frame dispatch by negotiated codec."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec,route", [
+        ("pcm", "_route_pcm"),
+        ("opus", "_route_opus"),
+        ("flac", "_route_flac"),
+    ])
+    async def test_frame_routed_by_codec(self, codec, route):
+        """Each codec id dispatches the payload to its route."""
+        from unittest.mock import AsyncMock
+        from linux_voice_assistant.sendspin.player import _CODEC_IDS
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        mock_route = AsyncMock()
+        setattr(pipeline, route, mock_route)
+        pipeline._codec_routes = (pipeline._route_pcm, pipeline._route_opus, pipeline._route_flac)
+        pipeline._stream_active = True
+        pipeline._codec_id = _CODEC_IDS[codec]
+
+        await pipeline.handle_binary_frame(bytes([4]) + (7).to_bytes(8, "big") + b"data")
+
+        mock_route.assert_awaited_once_with(b"data", 7)
+
+    @pytest.mark.asyncio
+    async def test_unknown_codec_is_dropped(self):
+        """Frames for an unsupported codec are ignored."""
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        pipeline._stream_active = True
+        pipeline._codec_id = -1
+
+        await pipeline.handle_binary_frame(bytes([4]) + (7).to_bytes(8, "big") + b"data")
+
+        assert pipeline._pcm_queue.empty()
+
+
+class TestStderrTail:
+    """Test mpv stderr tail capture."""
+
+    @pytest.mark.asyncio
+    async def test_tail_keeps_raw_lines(self):
+        """mpv stderr lines are stored as stripped bytes."""
+        from unittest.mock import MagicMock
+
+        pipeline = _make_pipeline(asyncio.get_running_loop())
+        stderr = asyncio.StreamReader()
+        stderr.feed_data(b"first line\n\xffbad utf8\n")
+        stderr.feed_eof()
+        proc = MagicMock()
+        proc.stderr = stderr
+
+        await pipeline._stderr_reader_loop(proc, name="mpv")
+
+        assert list(pipeline._mpv_stderr_tail) == [b"first line", b"\xffbad utf8"]
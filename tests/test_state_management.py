@@ -265,6 +265,53 @@ class TestMacAddressHandling:
         finally:
             temp_path.unlink(missing_ok=True)
 
+    @pytest.fixture
+    def sysfs_net(self, temp_dir, monkeypatch):
+        """Fake /sys/class/net tree; clears the cached MAC around the test."""
+        from linux_voice_assistant import util
+
+        monkeypatch.setattr(util, "_SYSFS_NET", str(temp_dir))
+        monkeypatch.setattr(util, "_CACHED_MAC", None)
+        monkeypatch.delenv("LVA_MAC", raising=False)
+
+        def _add(name, address):
+            (temp_dir / name).mkdir()
+            (temp_dir / name / "address").write_text(address + "\n")
+
+        return _add
+
+    def test_get_mac_address_prefers_wired_sysfs(self, sysfs_net):
+        """Wired interfaces win over wireless; loopback/zero MACs are skipped."""
+        from linux_voice_assistant.util import get_mac_address
+
+        sysfs_net("lo", "00:00:00:00:00:00")
+        sysfs_net("wlan0", "11:22:33:44:55:66")
+        sysfs_net("eth1", "AA:BB:CC:DD:EE:02")
+        sysfs_net("eth0", "AA:BB:CC:DD:EE:01")
+
+        assert get_mac_address() == "aabbccddee01"
+
+    def test_get_mac_address_falls_back_to_uuid(self, sysfs_net, monkeypatch):
+        """Without a usable sysfs entry the uuid.getnode() MAC is used."""
+        from linux_voice_assistant import util
+
+        sysfs_net("eth0", "00:00:00:00:00:00")
+        monkeypatch.setattr(util.uuid, "getnode", lambda: 0x0242AC110002)
+
+        assert util.get_mac_address() == "0242ac110002"
+
+    def test_get_mac_address_env_override(self, sysfs_net, monkeypatch):
+        """A valid LVA_MAC wins over sysfs; an invalid one is ignored."""
+        from linux_voice_assistant import util
+
+        sysfs_net("eth0", "AA:BB:CC:DD:EE:01")
+        monkeypatch.setenv("LVA_MAC", "02-42-AC-11-00-02")
+        assert util.get_mac_address() == "0242ac110002"
+
+        monkeypatch.setattr(util, "_CACHED_MAC", None)
+        monkeypatch.setenv("LVA_MAC", "not-a-mac")
+        assert util.get_mac_address() == "aabbccddee01"
+
 
 class TestStateTransitions:
     """Test state transitions and validation."""
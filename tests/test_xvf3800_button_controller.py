@@ -1,5 +1,6 @@
 """Tests for XVF3800 Button Controller hardware integration."""
 
+import os
 import pytest
 import threading
 import time
@@ -206,6 +207,45 @@ class TestXVF3800USBClient:
         assert result == True
         mock_device.ctrl_transfer.assert_called_once()
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.os.close')
+    @patch('linux_voice_assistant.xvf3800_button_controller.fcntl.ioctl')
+    @patch('linux_voice_assistant.xvf3800_button_controller.os.open', return_value=42)
+    @patch('linux_voice_assistant.xvf3800_button_controller.usb.core.find')
+    def test_usbfs_control_path(self, mock_usb_find, mock_open, mock_ioctl, mock_close):
+        """Test control transfers go through the usbfs ioctl when the node opens."""
+        import ctypes
+        from linux_voice_assistant.xvf3800_button_controller import _USBDEVFS_CONTROL
+
+        mock_device = MagicMock()
+        mock_device.bus = 1
+        mock_device.address = 5
+        mock_usb_find.return_value = mock_device
+
+        transfers = []
+
+        def fake_ioctl(fd, request, ct):
+            assert fd == 42
+            assert request == _USBDEVFS_CONTROL
+            if ct.bRequestType & 0x80:
+                ctypes.memmove(ct.data, bytes([0, 0, 1, 0, 1, 0]), 6)
+            else:
+                transfers.append(ctypes.string_at(ct.data, ct.wLength))
+            return ct.wLength
+
+        mock_ioctl.side_effect = fake_ioctl
+
+        client = XVF3800USBClient()
+        mock_open.assert_called_once_with("/dev/bus/usb/001/005", os.O_RDWR)
+
+        assert client.read_gpo_values() == bytes([0, 1, 0, 1, 0])
+        assert client.get_mute_gpo() is True
+        assert client.set_mute_gpo(True) is True
+        assert transfers == [bytes([30, 1])]
+        mock_device.ctrl_transfer.assert_not_called()
+
+        client.close()
+        mock_close.assert_called_once_with(42)
+
 
 class TestXVF3800ButtonRuntimeConfig:
     """Test XVF3800 button runtime configuration."""
@@ -214,7 +254,8 @@ class TestXVF3800ButtonRuntimeConfig:
         """Test default runtime configuration."""
         config = XVF3800ButtonRuntimeConfig()
 
-        assert config.poll_interval_seconds == 0.05  # 20 Hz default
+        assert config.poll_interval_seconds == 0.1  # 10 Hz default
+        assert config.max_idle_poll_interval_seconds == 0.5
 
     def test_custom_config(self):
         """Test custom runtime configuration."""
@@ -313,8 +354,8 @@ class TestXVF3800ButtonController:
             button_config=bad_config
         )
 
-        # Should default to 0.05s when invalid
-        assert controller._cfg.poll_interval_seconds == 0.05
+        # Should default to 0.1s when invalid
+        assert controller._cfg.poll_interval_seconds == 0.1
 
         controller.stop()
 
@@ -362,6 +403,24 @@ class TestXVF3800ButtonController:
 
         controller.stop()
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
+    def test_hardware_mute_echo_ignored(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
+        """Test mute events echoing the hardware button queue no write."""
+        mock_usb_client_class.return_value = MagicMock()
+
+        controller = XVF3800ButtonController(
+            loop=event_loop,
+            event_bus=event_bus,
+            state=mock_state,
+            button_config=button_config
+        )
+        controller.stop()
+
+        controller.mic_muted({"source": "xvf3800_hw"})
+        controller.mic_unmuted({"source": "xvf3800_hw"})
+
+        assert controller._take_target_mute_state() is None
+
     @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
     def test_stop_controller(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
         """Test stopping the button controller."""
@@ -385,6 +444,32 @@ class TestXVF3800ButtonController:
         assert controller._shutdown_flag.is_set()
         assert controller._usb_client is not None  # Client exists but may not be connected yet
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
+    def test_stop_wakes_sleeping_poll_thread(self, mock_usb_client_class, event_loop, event_bus, mock_state):
+        """Test stop() does not wait out a long poll interval."""
+        mock_usb_client = MagicMock()
+        mock_usb_client.read_gpo_values.return_value = [0, 0, 1, 1, 0]
+        mock_usb_client_class.return_value = mock_usb_client
+
+        slow_config = MagicMock()
+        slow_config.poll_interval_seconds = 5.0
+
+        controller = XVF3800ButtonController(
+            loop=event_loop,
+            event_bus=event_bus,
+            state=mock_state,
+            button_config=slow_config
+        )
+
+        # Let the thread reach its first wait
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        controller.stop()
+
+        assert time.monotonic() - start < 1.0
+        assert not controller._thread.is_alive()
+
 
 class TestXVF3800ButtonControllerHardwareIntegration:
     """Test XVF3800 Button Controller hardware integration scenarios."""
@@ -489,6 +574,33 @@ class TestXVF3800ButtonControllerHardwareIntegration:
         # Verify hardware mute was set
         mock_usb_client.set_mute_gpo.assert_called_with(True)
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
+    def test_software_mute_wakes_idle_poll_thread(self, mock_usb_client_class, event_loop, event_bus, mock_state):
+        """Test a mute change is applied without waiting out the poll interval."""
+        mock_usb_client = MagicMock()
+        mock_usb_client.read_gpo_values.return_value = [0, 0, 1, 1, 0]
+        mock_usb_client_class.return_value = mock_usb_client
+
+        slow_config = MagicMock()
+        slow_config.poll_interval_seconds = 5.0
+
+        controller = XVF3800ButtonController(
+            loop=event_loop,
+            event_bus=event_bus,
+            state=mock_state,
+            button_config=slow_config
+        )
+
+        # Let the thread reach its first wait
+        time.sleep(0.1)
+
+        controller.mic_muted({})
+        time.sleep(0.2)
+
+        controller.stop()
+
+        mock_usb_client.set_mute_gpo.assert_called_with(True)
+
     @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
     def test_usb_connection_retry_on_failure(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
         """Test USB connection retry on initialization failure."""
@@ -513,6 +625,29 @@ class TestXVF3800ButtonControllerHardwareIntegration:
         # Should have attempted reconnection
         assert mock_usb_client_class.call_count >= 1
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
+    def test_mute_event_while_device_absent_does_not_busy_loop(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
+        """Test a mute change while the device is absent keeps the retry backoff."""
+        mock_usb_client_class.side_effect = RuntimeError("Device not found")
+
+        controller = XVF3800ButtonController(
+            loop=event_loop,
+            event_bus=event_bus,
+            state=mock_state,
+            button_config=button_config
+        )
+
+        time.sleep(0.1)
+        attempts_before = mock_usb_client_class.call_count
+
+        controller.mic_muted({})
+        time.sleep(0.5)
+
+        controller.stop()
+
+        # One wake-up retry at most, not a tight loop of bus scans
+        assert mock_usb_client_class.call_count - attempts_before <= 3
+
 
 class TestXVF3800ButtonControllerErrorHandling:
     """Test XVF3800 Button Controller error handling."""
@@ -566,6 +701,30 @@ class TestXVF3800ButtonControllerErrorHandling:
 
         controller.stop()
 
+    @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
+    def test_usb_disconnect_drops_client(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
+        """Test a vanished device is closed and the client rebuilt."""
+        import errno
+        import usb.core
+
+        gone = MagicMock()
+        gone.read_gpo_values.side_effect = usb.core.USBError("No such device", errno=errno.ENODEV)
+        mock_usb_client_class.side_effect = [gone, MagicMock()]
+
+        controller = XVF3800ButtonController(
+            loop=event_loop,
+            event_bus=event_bus,
+            state=mock_state,
+            button_config=button_config
+        )
+
+        time.sleep(0.2)
+
+        controller.stop()
+
+        gone.close.assert_called_once()
+        assert mock_usb_client_class.call_count == 2
+
     @patch('linux_voice_assistant.xvf3800_button_controller.XVF3800USBClient')
     def test_usb_write_error_handling(self, mock_usb_client_class, event_loop, event_bus, mock_state, button_config):
         """Test handling of USB write errors."""
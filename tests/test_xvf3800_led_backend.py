@@ -1,7 +1,9 @@
 """Tests for XVF3800 LED Backend hardware integration."""
 
+import array
 import pytest
 import struct
+import threading
 import time
 from unittest.mock import Mock, MagicMock, patch
 
@@ -155,32 +157,99 @@ class TestReSpeakerLowLevel:
         assert resp.dev is None
         mock_dispose.assert_called_once_with(mock_device)
 
-    def test_pack_values_uint8(self):
+    def test_pack_into_uint8(self):
         """Test packing uint8 values."""
         mock_device = MagicMock()
         resp = _ReSpeaker(mock_device)
 
-        result = resp._pack_values("uint8", [1, 2, 3])
+        buf = bytearray(3)
+        resp._pack_into("uint8", [1, 2, 3], buf)
 
-        assert result == bytes([1, 2, 3])
+        assert buf == bytes([1, 2, 3])
 
-    def test_pack_values_uint32(self):
+    def test_pack_into_uint32(self):
         """Test packing uint32 values."""
         mock_device = MagicMock()
         resp = _ReSpeaker(mock_device)
 
-        result = resp._pack_values("uint32", [0x12345678, 0x00FF00FF])
+        buf = bytearray(8)
+        resp._pack_into("uint32", [0x12345678, 0x00FF00FF], buf)
 
         expected = struct.pack("<I", 0x12345678) + struct.pack("<I", 0x00FF00FF)
-        assert result == expected
+        assert buf == expected
 
-    def test_pack_values_unsupported_type(self):
+    def test_pack_into_int32_roundtrip(self):
+        """Test int32 values survive a pack/unpack round trip."""
+        mock_device = MagicMock()
+        resp = _ReSpeaker(mock_device)
+
+        buf = bytearray(12)
+        resp._pack_into("int32", [-12345, 67890, 0], buf)
+
+        assert buf == struct.pack("<3i", -12345, 67890, 0)
+        assert resp._unpack_values("int32", bytes(buf) + b"\x00", 3) == [-12345, 67890, 0]
+
+    def test_write_raw(self):
+        """Test a pre-packed payload is sent unchanged after a size check."""
+        mock_device = MagicMock()
+        resp = _ReSpeaker(mock_device)
+
+        payload = bytes(48)
+        resp.write_raw("LED_RING_COLOR", payload)
+
+        call_args = mock_device.ctrl_transfer.call_args[0]
+        assert call_args[2:4] == (19, 20)
+        assert bytes(call_args[4]) == payload
+
+        with pytest.raises(ValueError):
+            resp.write_raw("LED_RING_COLOR", bytes(47))
+        with pytest.raises(ValueError):
+            resp.write_raw("VERSION", bytes(3))
+
+    def test_write_reuses_payload_buffer(self):
+        """Writes of the same size are packed into one preallocated array('B')."""
+        mock_device = MagicMock()
+        resp = _ReSpeaker(mock_device)
+
+        resp.write("LED_RING_COLOR", [0x0000FF] * 12)
+        first = mock_device.ctrl_transfer.call_args[0][4]
+        resp.write_raw("LED_RING_COLOR", struct.pack("<12I", *range(12)))
+        second = mock_device.ctrl_transfer.call_args[0][4]
+
+        assert isinstance(first, array.array) and first.typecode == "B"
+        assert second is first
+        assert bytes(second) == struct.pack("<12I", *range(12))
+
+    def test_pack_into_prepacked_uint8(self):
+        """Byte buffers are accepted as already-packed uint8 values."""
+        mock_device = MagicMock()
+        resp = _ReSpeaker(mock_device)
+
+        buf = bytearray(2)
+        resp._pack_into("uint8", b"\x21\x01", buf)
+        assert buf == bytes([33, 1])
+
+        resp.write("GPO_WRITE_VALUE", bytearray([33, 1]))
+        assert bytes(mock_device.ctrl_transfer.call_args[0][4]) == bytes([33, 1])
+
+    def test_write_out_of_range(self):
+        """Values are no longer masked; out-of-range input is rejected."""
+        mock_device = MagicMock()
+        resp = _ReSpeaker(mock_device)
+
+        with pytest.raises(ValueError):
+            resp.write("LED_BRIGHTNESS", [256])
+        with pytest.raises(ValueError):
+            resp.write("LED_COLOR", [-1])
+        mock_device.ctrl_transfer.assert_not_called()
+
+    def test_pack_into_unsupported_type(self):
         """Test packing unsupported data type raises error."""
         mock_device = MagicMock()
         resp = _ReSpeaker(mock_device)
 
         with pytest.raises(ValueError) as exc_info:
-            resp._pack_values("unsupported", [1, 2, 3])
+            resp._pack_into("unsupported", [1, 2, 3], bytearray(3))
 
         assert "Unsupported data type" in str(exc_info.value)
 
@@ -213,25 +282,16 @@ class TestReSpeakerLowLevel:
 
         assert result == [-12345, 67890]
 
-    def test_read_length_calculation(self):
-        """Test read length calculation for different data types."""
-        mock_device = MagicMock()
-        resp = _ReSpeaker(mock_device)
+    def test_param_spec_read_length(self):
+        """Read lengths are resolved per parameter: payload + status byte."""
+        from linux_voice_assistant.xvf3800_led_backend import _PARAM_SPECS
 
         # uint8: count + status byte
-        assert resp._read_length("uint8", 5) == 6
+        assert _PARAM_SPECS["GPO_READ_VALUES"].read_length == 6
 
-        # uint32/int32: (count * 4) + status byte
-        assert resp._read_length("uint32", 12) == 49  # (12 * 4) + 1
-        assert resp._read_length("int32", 3) == 13   # (3 * 4) + 1
-
-    def test_read_length_unsupported_type(self):
-        """Test read length calculation for unsupported type raises error."""
-        mock_device = MagicMock()
-        resp = _ReSpeaker(mock_device)
-
-        with pytest.raises(ValueError):
-            resp._read_length("unsupported", 1)
+        # uint32: (count * 4) + status byte
+        assert _PARAM_SPECS["LED_RING_COLOR"].read_length == 49  # (12 * 4) + 1
+        assert _PARAM_SPECS["LED_COLOR"].read_length == 5
 
     def test_write_success(self):
         """Test successful parameter write produces the correct USB control transfer."""
@@ -263,7 +323,7 @@ class TestReSpeakerLowLevel:
         assert args[3] == 20  # GPO_SERVICER_RESID
 
         # Check payload
-        assert args[4] == bytes([2])
+        assert bytes(args[4]) == bytes([2])
 
     def test_write_read_only_parameter(self):
         """Test writing to read-only parameter raises error."""
@@ -595,18 +655,11 @@ class TestXVF3800LedBackend:
 
         backend.set_ring_colors([0xFF0000, 0x00FF00, 0x0000FF] + [0] * 9)
 
-        # set_ring_colors calls _ensure_led_power() first, so there may be an
-        # additional GPO_WRITE_VALUE call. Filter to LED_RING_COLOR specifically.
-        ring_calls = [
-            c for c in mock_resp.write.call_args_list
-            if c[0][0] == "LED_RING_COLOR"
-        ]
-        assert len(ring_calls) == 1, (
-            f"Expected exactly one LED_RING_COLOR write, got {len(ring_calls)}"
+        # The values are packed once and sent like any other ring frame
+        mock_resp.write_raw.assert_called_once_with(
+            "LED_RING_COLOR",
+            struct.pack("<12I", 0xFF0000, 0x00FF00, 0x0000FF, *([0] * 9)),
         )
-        # Sanity-check the payload length
-        payload = ring_calls[0][0][1]
-        assert len(payload) == 12
 
     @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
     def test_set_ring_colors_wrong_count(self, mock_find):
@@ -643,16 +696,19 @@ class TestXVF3800LedBackend:
         backend = XVF3800LedBackend()
         _finish_init(mock_resp)
 
-        # Create 12 RGB tuples
-        colors = [(255, 0, 0), (0, 255, 0)] + [(0, 0, 255)] * 10
+        # Create 12 RGB tuples; out-of-range channels are clamped
+        colors = [(255, 0, 0), (300, -5, 0)] + [(0, 0, 255)] * 10
         backend.set_ring_rgb(colors)
 
-        # Filter to LED_RING_COLOR; _ensure_led_power may have written GPO too.
-        ring_calls = [
+        # The ring is packed to bytes up front and sent through write_raw
+        mock_resp.write_raw.assert_called_once_with(
+            "LED_RING_COLOR",
+            struct.pack("<12I", 0xFF0000, 0xFF0000, *([0x0000FF] * 10)),
+        )
+        assert not [
             c for c in mock_resp.write.call_args_list
             if c[0][0] == "LED_RING_COLOR"
         ]
-        assert len(ring_calls) == 1
 
     @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
     def test_set_ring_solid(self, mock_find):
@@ -665,17 +721,13 @@ class TestXVF3800LedBackend:
 
         backend.set_ring_solid(100, 150, 200)
 
-        # Filter to LED_RING_COLOR
-        ring_calls = [
-            c for c in mock_resp.write.call_args_list
-            if c[0][0] == "LED_RING_COLOR"
-        ]
-        assert len(ring_calls) == 1
+        mock_resp.write_raw.assert_called_once()
+        name, payload = mock_resp.write_raw.call_args[0]
+        assert name == "LED_RING_COLOR"
 
         # Verify all 12 LEDs have same color
-        colors = ring_calls[0][0][1]
         expected_color = (100 << 16) | (150 << 8) | 200
-        assert all(c == expected_color for c in colors)
+        assert struct.unpack("<12I", payload) == (expected_color,) * 12
 
     @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
     def test_clear_ring(self, mock_find):
@@ -688,13 +740,8 @@ class TestXVF3800LedBackend:
 
         backend.clear_ring()
 
-        # The relevant write is LED_RING_COLOR with 12 zeros.
-        ring_calls = [
-            c for c in mock_resp.write.call_args_list
-            if c[0][0] == "LED_RING_COLOR"
-        ]
-        assert len(ring_calls) == 1
-        assert ring_calls[0] == (("LED_RING_COLOR", [0] * 12),)
+        # The relevant write is LED_RING_COLOR with 12 zeroed uint32s.
+        mock_resp.write_raw.assert_called_once_with("LED_RING_COLOR", bytes(48))
 
     @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
     def test_clear_ring_legacy_fallback(self, mock_find):
@@ -756,6 +803,127 @@ class TestXVF3800LedBackend:
         mock_resp.close.assert_called_once()
 
 
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_unchanged_ring_frame_is_skipped(self, mock_find):
+        """Re-sending the last ring frame does no USB I/O until invalidated."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend()
+        _finish_init(mock_resp)
+        mock_resp.read.return_value = [0, 1, 1, 1, 0]  # X0D33 (index 3) high
+
+        backend.set_ring_solid(10, 20, 30)
+        backend.set_ring_rgb([(10, 20, 30)] * 12)
+        backend.set_ring_colors([0x0A141E] * 12)
+        assert mock_resp.write_raw.call_count == 1
+
+        backend.clear_ring()
+        backend.set_ring_solid(10, 20, 30)
+        assert mock_resp.write_raw.call_count == 3
+
+        backend.invalidate_cache()
+        backend.set_ring_solid(10, 20, 30)
+        assert mock_resp.write_raw.call_count == 4
+
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_failed_ring_frame_is_retried(self, mock_find):
+        """A frame that failed to send is not remembered as the last frame."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend()
+        _finish_init(mock_resp)
+        mock_resp.write_raw.side_effect = [RuntimeError("usb"), None]
+
+        with pytest.raises(RuntimeError):
+            backend.set_ring_solid(1, 2, 3)
+        backend.set_ring_solid(1, 2, 3)
+        assert mock_resp.write_raw.call_count == 2
+
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_unchanged_scalar_writes_are_skipped(self, mock_find):
+        """Brightness, speed and colour are only re-sent on change; effect always is."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend()
+        _finish_init(mock_resp)
+
+        for _ in range(2):
+            backend.set_effect(0)
+            backend.set_brightness(128)
+            backend.set_speed(1)
+            backend.set_color(1, 2, 3)
+
+        names = [c[0][0] for c in mock_resp.write.call_args_list]
+        assert names == [
+            "LED_EFFECT", "LED_BRIGHTNESS", "LED_SPEED", "LED_COLOR", "LED_EFFECT"
+        ]
+
+        backend.set_brightness(64)
+        backend.invalidate_cache()
+        backend.set_brightness(64)
+        names = [c[0][0] for c in mock_resp.write.call_args_list]
+        assert names[5:] == ["LED_BRIGHTNESS", "LED_BRIGHTNESS"]
+
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_coalesced_frames_keep_only_latest(self, mock_find):
+        """With coalesce_frames, stale pending ring frames are dropped."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend(coalesce_frames=True)
+        _finish_init(mock_resp)
+        mock_resp.read.return_value = [0, 1, 1, 1, 0]  # X0D33 (index 3) high
+
+        first_started = threading.Event()
+        release = threading.Event()
+
+        def slow_write_raw(name, payload):
+            first_started.set()
+            release.wait(timeout=5)
+
+        mock_resp.write_raw.side_effect = slow_write_raw
+
+        backend.set_ring_solid(1, 0, 0)
+        assert first_started.wait(timeout=5)
+        # The worker is busy: these replace each other in the pending slot
+        backend.set_ring_solid(2, 0, 0)
+        backend.set_ring_solid(3, 0, 0)
+        release.set()
+        assert backend.flush(timeout=5)
+
+        sent = [c[0][1] for c in mock_resp.write_raw.call_args_list]
+        assert sent == [
+            struct.pack("<I", 0x010000) * 12,
+            struct.pack("<I", 0x030000) * 12,
+        ]
+        backend.close()
+
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_coalesced_frames_flush_before_ordered_writes(self, mock_find):
+        """Effect writes are never overtaken by an older pending frame."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend(coalesce_frames=True)
+        _finish_init(mock_resp)
+        mock_resp.read.return_value = [0, 1, 1, 1, 0]
+
+        backend.clear_ring()
+        backend.set_effect(1)
+
+        names = [
+            c[1][0] for c in mock_resp.method_calls if c[0] in ("write", "write_raw")
+        ]
+        assert names[-2:] == ["LED_RING_COLOR", "LED_EFFECT"]
+
+        backend.close()
+        assert backend._frame_thread is None
+        mock_resp.close.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Error handling and LED-power belt-and-suspenders behaviour
 # ---------------------------------------------------------------------------
@@ -811,6 +979,46 @@ class TestXVF3800LedBackendErrorHandling:
             "WS2812 LED power should be re-enabled if reported off"
         )
 
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_led_power_check_is_rate_limited(self, mock_find):
+        """A confirmed power check is reused until it expires or is forced."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend()
+        _finish_init(mock_resp)
+        mock_resp.read.return_value = [0, 1, 1, 1, 0]  # X0D33 (index 3) high
+
+        backend.set_ring_solid(255, 0, 0)
+        backend.set_ring_solid(0, 255, 0)
+        backend.clear_ring()
+        assert mock_resp.read.call_count == 1
+
+        assert backend._ensure_led_power(force=True)
+        assert mock_resp.read.call_count == 2
+
+        backend._power_verified_at -= backend.LED_POWER_CHECK_INTERVAL_S
+        backend.set_ring_solid(0, 0, 255)
+        assert mock_resp.read.call_count == 3
+
+    @patch('linux_voice_assistant.xvf3800_led_backend._find_device')
+    def test_invalidate_cache_rechecks_led_power(self, mock_find):
+        """After invalidate_cache() the next write re-reads GPO_READ_VALUES."""
+        mock_resp = _make_init_mock()
+        mock_find.return_value = mock_resp
+
+        backend = XVF3800LedBackend()
+        _finish_init(mock_resp)
+        mock_resp.read.return_value = [0, 1, 1, 1, 0]  # X0D33 (index 3) high
+
+        backend.set_ring_solid(255, 0, 0)
+        assert mock_resp.read.call_count == 1
+
+        backend.invalidate_cache()
+        backend.set_ring_solid(255, 0, 0)
+        assert mock_resp.read.call_count == 2
+        mock_resp.read.assert_called_with("GPO_READ_VALUES")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -25,7 +25,6 @@ import argparse
 import binascii
 import datetime as dt
 import sys
-import time
 from typing import List, Optional
 
 try:
@@ -89,7 +88,9 @@ def open_device(
         print(f"Opening HID device by VID/PID: {_fmt_vid_pid(vendor_id, product_id)}")
         dev.open(vendor_id, product_id)
 
-    dev.set_nonblocking(True)
+    # Blocking mode: read(timeout_ms=...) sleeps in the kernel until a report
+    # arrives or the timeout expires, so no extra sleep is needed.
+    dev.set_nonblocking(False)
     return dev
 
 
@@ -166,7 +167,6 @@ def main() -> int:
                 # Trim trailing zeroes for readability
                 hex_str = hex_str.rstrip("0") or hex_str
                 print(f"[{now}] len={len(raw):02d} report={hex_str}")
-            time.sleep(0.01)
     except KeyboardInterrupt:
         print("\nStopping probe.")
     finally: